@@ -2,6 +2,9 @@ from typing import List, Dict, Set
 from datetime import datetime
 import re
 import logging
+import time
+
+from app.near_duplicates import NearDuplicateIndex
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -12,7 +15,8 @@ class AggregatorService:
     def remove_duplicates(articles: List[Dict]) -> List[Dict]:
         unique_articles = []
         seen_urls = set()
-        seen_titles = set()
+        # Indexed so each title is checked against a few candidates, not every title seen so far
+        seen_titles = NearDuplicateIndex(threshold=0.8)
         
         for article in articles:
             url = article.get('url', '')
@@ -23,17 +27,11 @@ class AggregatorService:
             
             normalized_title = AggregatorService.normalize_title(title)
             
-            is_duplicate = False
-            for seen_title in seen_titles:
-                if AggregatorService.titles_are_similar(normalized_title, seen_title):
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
+            if seen_titles.find(normalized_title) is None:
                 unique_articles.append(article)
                 if url:
                     seen_urls.add(url)
-                seen_titles.add(normalized_title)
+                seen_titles.add(normalized_title, normalized_title)
         
         logger.info(f"Deduplication: {len(articles)} -> {len(unique_articles)} articles")
         return unique_articles
@@ -70,25 +68,12 @@ class AggregatorService:
     
     @staticmethod
     def sort_by_date(articles: List[Dict]) -> List[Dict]:
-        return sorted(articles, key=lambda x: x.get('published', ''), reverse=True)
+        return sorted(articles, key=lambda x: x.get('published_ts') or 0, reverse=True)
     
     @staticmethod
     def filter_by_recency(articles: List[Dict], hours: int = 48) -> List[Dict]:
-        from datetime import timedelta
-        from dateutil import parser as date_parser
-        
-        cutoff = datetime.now() - timedelta(hours=hours)
-        filtered = []
-        
-        for article in articles:
-            try:
-                pub_date_str = article.get('published', '')
-                if pub_date_str:
-                    pub_date = date_parser.parse(pub_date_str)
-                    if pub_date >= cutoff:
-                        filtered.append(article)
-            except:
-                filtered.append(article)
+        cutoff_ts = int(time.time()) - hours * 3600
+        filtered = [article for article in articles if (article.get('published_ts') or 0) >= cutoff_ts]
         
         logger.info(f"Filtered {len(articles)} articles to {len(filtered)} within {hours} hours")
         return filtered
@@ -105,6 +90,11 @@ class AggregatorService:
         
         unique_articles = AggregatorService.remove_duplicates(all_articles)
         
+        return AggregatorService.build_results(unique_articles, max_results)
+    
+    @staticmethod
+    def build_results(unique_articles: List[Dict], max_results: int = 50) -> Dict:
+        """Shape already sorted, deduplicated articles into the /api/news payload"""
         limited_articles = unique_articles[:max_results]
         
         return {
@@ -0,0 +1,72 @@
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
+import json
+import sys
+
+
+@dataclass(frozen=True, slots=True)
+class Article:
+    """
+    One finished article as held in the cache, merged view and snapshots.
+
+    Pipelines build plain dicts while parsing and stamping; they become an Article once they
+    leave the fetch stage. Slots and interned source/content_type strings keep the long-lived
+    history compact, and read access matches the old dicts (article['url'], article.get('image')).
+    """
+
+    title: str
+    description: str
+    url: str
+    published: str
+    published_ts: int
+    source: str
+    image: Optional[str]
+    content_type: str
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Article':
+        return cls(
+            title=data.get('title') or '',
+            description=data.get('description') or '',
+            url=data.get('url') or '',
+            published=data.get('published') or '',
+            published_ts=data.get('published_ts') or 0,
+            source=sys.intern(data.get('source') or ''),
+            image=data.get('image'),
+            content_type=sys.intern(data.get('content_type') or 'news'),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'title': self.title,
+            'description': self.description,
+            'url': self.url,
+            'published': self.published,
+            'published_ts': self.published_ts,
+            'source': self.source,
+            'image': self.image,
+            'content_type': self.content_type,
+        }
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in FIELD_SET:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return getattr(self, name) if name in FIELD_SET else default
+
+
+FIELD_NAMES = tuple(field.name for field in fields(Article))
+FIELD_SET = frozenset(FIELD_NAMES)
+
+
+def encode_default(value: Any) -> Any:
+    if type(value) is Article:
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload: Any) -> bytes:
+    """Compact UTF-8 JSON for payloads containing Articles (encoded by the C encoder via `default`)"""
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=encode_default).encode('utf-8')
@@ -0,0 +1,192 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from app.article import Article, dumps
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+
+def canonical_url(url: str) -> str:
+    """Normalize an article URL so the same story always maps to the same row"""
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    ))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+class ArticleStore(ABC):
+    """
+    Persistent per-source article snapshot. Each source refresh is written as one batched
+    upsert keyed on (source_id, canonical URL); rows the refresh no longer returned are
+    marked inactive, so load_snapshot() returns exactly the last-known set per source.
+    Methods are blocking; call them from a thread (asyncio.to_thread).
+    """
+
+    placeholder = '?'
+    retention_days = 30
+
+    def __init__(self):
+        self.conn = None
+        self.lock = threading.Lock()
+
+    @abstractmethod
+    def connect(self):
+        """Open a DB-API connection to the backend"""
+
+    def open(self):
+        if self.conn is not None:
+            return
+
+        self.conn = self.connect()
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    source_id TEXT NOT NULL,
+                    canonical_url TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    published TEXT,
+                    article TEXT NOT NULL,
+                    active INTEGER NOT NULL DEFAULT 1,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (source_id, canonical_url)
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS articles_active ON articles (active, source_id)")
+            self.conn.commit()
+        logger.info(f"Article store opened ({type(self).__name__})")
+
+    def close(self):
+        if self.conn is None:
+            return
+
+        with self.lock:
+            self.conn.close()
+            self.conn = None
+
+    def save_source(self, source_id: str, kind: str, articles: List[Article]):
+        """Upsert a source's current article set in one batch and deactivate everything else it had"""
+        p = self.placeholder
+        batch_time = datetime.now().isoformat()
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+
+        rows = {}
+        for article in articles:
+            key = canonical_url(article.get('url', '')) or article.get('title', '')
+            rows.setdefault(key, (
+                source_id,
+                key,
+                kind,
+                article.get('published'),
+                dumps(article).decode('utf-8'),
+                batch_time
+            ))
+
+        with self.lock:
+            cursor = self.conn.cursor()
+            try:
+                if rows:
+                    cursor.executemany(f"""
+                        INSERT INTO articles (source_id, canonical_url, kind, published, article, active, updated_at)
+                        VALUES ({p}, {p}, {p}, {p}, {p}, 1, {p})
+                        ON CONFLICT (source_id, canonical_url) DO UPDATE SET
+                            kind = excluded.kind,
+                            published = excluded.published,
+                            article = excluded.article,
+                            active = 1,
+                            updated_at = excluded.updated_at
+                    """, list(rows.values()))
+                cursor.execute(
+                    f"UPDATE articles SET active = 0 WHERE source_id = {p} AND active = 1 AND updated_at <> {p}",
+                    (source_id, batch_time)
+                )
+                cursor.execute(f"DELETE FROM articles WHERE active = 0 AND updated_at < {p}", (cutoff,))
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+    def load_snapshot(self) -> Dict[str, Dict]:
+        """{source_id: {'kind', 'articles', 'updated_at'}} for every source's active articles"""
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT source_id, kind, article, updated_at FROM articles WHERE active = 1 ORDER BY published DESC"
+            )
+            rows = cursor.fetchall()
+
+        snapshot = {}
+        for source_id, kind, article, updated_at in rows:
+            state = snapshot.setdefault(source_id, {'kind': kind, 'articles': [], 'updated_at': updated_at})
+            state['articles'].append(json.loads(article))
+            state['updated_at'] = max(state['updated_at'], updated_at)
+        return snapshot
+
+
+class SQLiteArticleStore(ArticleStore):
+    """Single-node store in a local SQLite file"""
+
+    placeholder = '?'
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+
+    def connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+
+class PostgresArticleStore(ArticleStore):
+    """Shared store in Postgres via psycopg"""
+
+    placeholder = '%s'
+
+    def __init__(self, dsn: str):
+        super().__init__()
+        self.dsn = dsn
+
+    def connect(self):
+        import psycopg
+
+        return psycopg.connect(self.dsn)
+
+
+def create_article_store(database_url: Optional[str] = None, sqlite_path: str = 'data/articles.db') -> ArticleStore:
+    """Postgres when database_url is a postgres:// DSN, otherwise a local SQLite file"""
+    if database_url and database_url.startswith(('postgres://', 'postgresql://')):
+        return PostgresArticleStore(database_url)
+    return SQLiteArticleStore(sqlite_path)
+
+
+article_store = create_article_store(
+    os.environ.get('DATABASE_URL'),
+    os.environ.get('ARTICLE_DB_PATH', 'data/articles.db')
+)
@@ -1,8 +1,19 @@
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from heapq import nlargest
 import asyncio
 import logging
 
+from app.aggregator_service import AggregatorService
+from app.article import Article
+from app.event_stream import event_broadcaster
+from app.metrics import pipeline_metrics
+from app.merged_view import MergedView
+from app.news_index import NewsIndex
+from app.search_index import SearchIndex
+from app.snapshot import RenderedSnapshot
+from app.tracer import tracer
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -17,47 +28,289 @@ class CacheManager:
         }
         self.lock = asyncio.Lock()
         self.update_interval_hours = 6
-        self.is_updating = False
+        # Snapshots are served stale (while a refresh runs) up to this age, never beyond it
+        self.hard_stale_hours = 24
+        self.refresh_task: Optional[asyncio.Task] = None
+        # What the in-flight refresh covers: 'full', a kind, 'scheduled' or 'sync'
+        self.refresh_scope: Optional[str] = None
+        
+        # Each cache version is serialized (and compressed) once, when it is set
+        self.version = 0
+        self.snapshot: Optional[RenderedSnapshot] = None
+        # Filter/pagination index over the full deduplicated set of the current version
+        self.news_index: Optional[NewsIndex] = None
+        
+        # Per-source last-known article sets, merged incrementally
+        self.merged_view = MergedView()
+        self.sources: Dict[str, Dict] = {}
+        
+        # Full-text index over the visible merged view, updated from its deltas
+        self.search_index = SearchIndex()
+        
+        # Articles that became visible since the last published version, pushed to stream subscribers
+        self.event_broadcaster = event_broadcaster
+        self.pending_added: Dict[int, Article] = {}
+        # Whether a source delta added or removed visible articles since the last published version
+        self.has_unpublished_changes = False
+        # A cold start adds every article at once; subscribers get the newest and re-read /api/news
+        self.max_event_articles = 100
+        
+        self.metrics = pipeline_metrics
+        self.tracer = tracer
+    
+    @property
+    def is_updating(self) -> bool:
+        return self.refresh_task is not None and not self.refresh_task.done()
+    
+    def start_refresh(self, updater: Callable[[], Awaitable[None]], scope: str = 'full') -> asyncio.Task:
+        """Start updater unless a refresh is already in flight; either way return the in-flight task"""
+        if not self.is_updating:
+            self.refresh_task = asyncio.create_task(updater())
+            self.refresh_scope = scope
+        return self.refresh_task
+    
+    async def refresh(self, updater: Callable[[], Awaitable[None]], scope: str = 'full'):
+        """
+        Wait for the single in-flight refresh; a cancelled caller does not cancel it for the others.
+        Only a full cycle or a refresh of the same scope stands in for updater; any other
+        in-flight refresh is waited out first, then updater runs.
+        """
+        while True:
+            task = self.start_refresh(updater, scope)
+            if self.refresh_scope in ('full', scope):
+                await asyncio.shield(task)
+                return
+            # Waiting does not cancel the other refresh, nor raise its errors here
+            await asyncio.wait({task})
     
-    async def get_cached_results(self) -> Optional[Dict]:
+    def get_snapshot_age(self) -> Optional[timedelta]:
+        if not self.cache['last_updated']:
+            return None
+        return datetime.now() - self.cache['last_updated']
+    
+    def is_stale(self) -> bool:
+        age = self.get_snapshot_age()
+        return age is None or age >= timedelta(hours=self.update_interval_hours)
+    
+    async def get_partition(self, kind: str) -> Optional[Dict]:
+        """One kind's slice of the snapshot ('national' or 'local'), under the same staleness rule"""
         async with self.lock:
             if self.cache['merged_results'] and self.cache['last_updated']:
-                time_since_update = datetime.now() - self.cache['last_updated']
-                if time_since_update < timedelta(hours=self.update_interval_hours):
-                    logger.info(f"Returning cached results (age: {time_since_update})")
-                    result = self.cache['merged_results'].copy()
-                    result['national_articles'] = self.cache['national_articles']
-                    result['local_articles'] = self.cache['local_articles']
-                    result['last_updated'] = self.cache['last_updated'].isoformat()
-                    return result
+                if datetime.now() - self.cache['last_updated'] < timedelta(hours=self.hard_stale_hours):
+                    return {
+                        'articles': self.cache[f'{kind}_articles'],
+                        'last_updated': self.cache['last_updated'].isoformat()
+                    }
         return None
     
+    def build_payload(self) -> Dict:
+        result = self.cache['merged_results'].copy()
+        result['national_articles'] = self.cache['national_articles']
+        result['local_articles'] = self.cache['local_articles']
+        result['last_updated'] = self.cache['last_updated'].isoformat()
+        return result
+    
+    def get_news_index(self) -> Optional[NewsIndex]:
+        """Index behind filtered /api/news queries, unless past hard_stale_hours"""
+        age = self.get_snapshot_age()
+        if self.news_index is None or age is None or age >= timedelta(hours=self.hard_stale_hours):
+            return None
+        return self.news_index
+    
+    def get_rendered_snapshot(self) -> Optional[RenderedSnapshot]:
+        """Pre-serialized /api/news body for the current version, unless past hard_stale_hours"""
+        snapshot = self.snapshot
+        if snapshot is None:
+            return None
+        if datetime.now() - snapshot.last_updated >= timedelta(hours=self.hard_stale_hours):
+            return None
+        return snapshot
+    
     async def set_cached_results(
         self,
         national_articles: list,
         local_articles: list,
-        merged_results: Dict
+        merged_results: Dict,
+        last_updated: Optional[datetime] = None,
+        news_index: Optional[NewsIndex] = None,
+        version: Optional[int] = None
     ):
+        """`version` adopts another worker's version number (multi-worker mode) instead of counting up"""
         async with self.lock:
             self.cache['national_articles'] = national_articles
             self.cache['local_articles'] = local_articles
             self.cache['merged_results'] = merged_results
-            self.cache['last_updated'] = datetime.now()
+            self.cache['last_updated'] = last_updated or datetime.now()
+            if news_index is not None:
+                self.news_index = news_index
+            self.version = version if version is not None else self.version + 1
+            version = self.version
+            payload = self.build_payload()
             logger.info(f"Cache updated with {len(national_articles)} national and {len(local_articles)} local articles")
+        
+        # Serialize and compress off the event loop, then swap the new version in atomically
+        snapshot = await asyncio.to_thread(RenderedSnapshot, version, payload, self.cache['last_updated'])
+        if self.snapshot is None or snapshot.version > self.snapshot.version:
+            self.snapshot = snapshot
+            self.notify_subscribers(snapshot)
     
-    def should_update(self) -> bool:
-        if not self.cache['last_updated']:
-            return True
+    def notify_subscribers(self, snapshot: RenderedSnapshot):
+        added = self.pending_added
+        self.pending_added = {}
+        if added:
+            newest = nlargest(self.max_event_articles, added.values(), key=lambda article: article.published_ts)
+            self.event_broadcaster.publish('articles', {
+                'version': snapshot.version,
+                'count': len(newest),
+                'total_added': len(added),
+                'articles': newest
+            })
+        self.event_broadcaster.publish('version', self.version_event(snapshot))
+    
+    def version_event(self, snapshot: RenderedSnapshot) -> Dict:
+        return {
+            'version': snapshot.version,
+            'etag': snapshot.etag,
+            'last_updated': snapshot.last_updated.isoformat()
+        }
+    
+    async def apply_source_update(
+        self,
+        source_id: str,
+        kind: str,
+        articles: List[Article],
+        refreshed_at: Optional[datetime] = None
+    ) -> Tuple[List[Article], List[Article]]:
+        """Replace one source's article set ('national' or 'local') and merge only its delta"""
+        async with self.lock:
+            added, removed = self.merge_delta(source_id, articles)
+            self.sources[source_id] = {
+                'kind': kind,
+                'article_count': len(articles),
+                'last_refreshed': refreshed_at or datetime.now()
+            }
+        return added, removed
+    
+    async def expire(self, cutoffs: Dict[str, int]) -> int:
+        """
+        Drop retained articles published before their kind's cutoff ({kind: published_ts}).
+        Sources that keep failing are never re-fetched, so their last-known sets age out here.
+        """
+        expired = 0
+        async with self.lock:
+            for source_id, retained in list(self.merged_view.source_articles.items()):
+                cutoff_ts = cutoffs.get(self.sources[source_id]['kind'])
+                if cutoff_ts is None:
+                    continue
+                kept = [article for article in retained.values() if article.published_ts >= cutoff_ts]
+                if len(kept) == len(retained):
+                    continue
+                self.merge_delta(source_id, kept)
+                self.sources[source_id]['article_count'] = len(kept)
+                self.metrics.articles_dropped.inc(len(retained) - len(kept), source=source_id, reason='recency')
+                expired += len(retained) - len(kept)
+        if expired:
+            logger.info(f"Expired {expired} retained articles")
+        return expired
+    
+    def merge_delta(self, source_id: str, articles: List[Article]) -> Tuple[List[Article], List[Article]]:
+        """Apply a source's new set to the merged view and search index; callers hold the lock"""
+        added, removed = self.merged_view.apply(source_id, articles)
+        self.search_index.apply(added, removed)
+        if added or removed:
+            self.has_unpublished_changes = True
+        for article in removed:
+            self.pending_added.pop(id(article), None)
+        for article in added:
+            self.pending_added[id(article)] = article
+        return added, removed
+    
+    async def publish(
+        self,
+        local_filter: Optional[Callable[[List[Article]], List[Article]]] = None,
+        max_results: int = 50,
+        last_updated: Optional[datetime] = None,
+        version: Optional[int] = None,
+        cutoffs: Optional[Dict[str, int]] = None
+    ) -> Dict:
+        """
+        Render the merged view into the cached payload. This is a single ordered pass:
+        the view is already sorted and deduplicated. `cutoffs` expires old retained articles first.
+        """
+        if cutoffs:
+            await self.expire(cutoffs)
+        ordered_items = self.merged_view.ordered_items()
+        self.has_unpublished_changes = False
+        national_articles = []
+        local_candidates = []
+        for source_id, article in ordered_items:
+            if self.sources[source_id]['kind'] == 'national':
+                national_articles.append(article)
+            else:
+                local_candidates.append(article)
+        
+        with self.tracer.span('diversity_filter', candidates=len(local_candidates)):
+            local_articles = local_filter(local_candidates) if local_filter else local_candidates
+        kept_local = {id(article) for article in local_articles}
+        
+        merged_entries = [
+            (MergedView.article_key(source_id, article), article) for source_id, article in ordered_items
+            if self.sources[source_id]['kind'] == 'national' or id(article) in kept_local
+        ]
+        with self.tracer.span('build_results'):
+            merged_results = AggregatorService.build_results(
+                [article for _, article in merged_entries],
+                max_results=max_results
+            )
+        
+        source_count = sum(len(articles) for articles in self.merged_view.source_articles.values())
+        self.metrics.snapshot_articles.replace({
+            ('sources',): source_count,
+            ('deduplicated',): len(ordered_items),
+            ('published',): len(merged_entries)
+        })
+        self.metrics.snapshot_dropped.replace({
+            ('dedup',): source_count - len(ordered_items),
+            ('diversity',): len(local_candidates) - len(local_articles)
+        })
         
-        time_since_update = datetime.now() - self.cache['last_updated']
-        return time_since_update >= timedelta(hours=self.update_interval_hours)
+        # The legacy payload stops at max_results; the index covers the full deduplicated set
+        with self.tracer.span('news_index', articles=len(merged_entries)):
+            news_index = await asyncio.to_thread(NewsIndex, merged_entries)
+        
+        with self.tracer.span('render_snapshot'):
+            await self.set_cached_results(national_articles, local_articles, merged_results, last_updated, news_index, version)
+        return merged_results
+    
+    def export_sources(self) -> Dict[str, Dict]:
+        """Every source's last-known article set, as written to the shared snapshot"""
+        return {
+            source_id: {
+                'kind': state['kind'],
+                'refreshed_at': state['last_refreshed'].isoformat(),
+                'articles': list(self.merged_view.source_articles.get(source_id, {}).values())
+            }
+            for source_id, state in self.sources.items()
+        }
     
     def get_cache_info(self) -> Dict:
+        age = self.get_snapshot_age()
         return {
             'last_updated': self.cache['last_updated'].isoformat() if self.cache['last_updated'] else None,
+            'age_seconds': int(age.total_seconds()) if age is not None else None,
+            'is_stale': self.is_stale(),
+            'version': self.version,
             'national_count': len(self.cache['national_articles']),
             'local_count': len(self.cache['local_articles']),
-            'is_updating': self.is_updating
+            'is_updating': self.is_updating,
+            'sources': {
+                source_id: {
+                    'kind': state['kind'],
+                    'article_count': state['article_count'],
+                    'last_refreshed': state['last_refreshed'].isoformat()
+                }
+                for source_id, state in self.sources.items()
+            }
         }
 
 cache_manager = CacheManager()
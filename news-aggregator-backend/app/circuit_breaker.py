@@ -0,0 +1,85 @@
+from typing import Dict, Optional
+import logging
+import time
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class BreakerState:
+    def __init__(self):
+        self.consecutive_failures = 0
+        self.open_until: Optional[float] = None
+        self.backoff: float = 0
+        self.times_opened = 0
+
+
+class CircuitBreaker:
+    """
+    Per-source circuit breakers. After failure_threshold consecutive failures a source's
+    breaker opens and the source is skipped for `base_backoff` seconds; then one probe is
+    let through (half-open). A failed probe reopens it with the backoff doubled (up to
+    max_backoff), a success closes it.
+    """
+
+    def __init__(self, failure_threshold: int = 3, base_backoff: float = 300, max_backoff: float = 6 * 3600):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.states: Dict[str, BreakerState] = {}
+
+    def retry_in(self, source_id: str, now: Optional[float] = None) -> Optional[float]:
+        """None if source_id may be fetched now, else seconds until its next probe"""
+        state = self.states.get(source_id)
+        if state is None or state.open_until is None:
+            return None
+        remaining = state.open_until - (time.monotonic() if now is None else now)
+        return remaining if remaining > 0 else None
+
+    def record_success(self, source_id: str):
+        state = self.states.get(source_id)
+        if state is None:
+            return
+        if state.open_until is not None:
+            logger.info(f"Circuit for {source_id} closed after a successful probe")
+        state.consecutive_failures = 0
+        state.open_until = None
+        state.backoff = 0
+
+    def record_failure(self, source_id: str, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        state = self.states.setdefault(source_id, BreakerState())
+        state.consecutive_failures += 1
+
+        if state.open_until is not None:
+            # Failed probe: stay open, twice as long
+            state.backoff = min(state.backoff * 2, self.max_backoff)
+        elif state.consecutive_failures >= self.failure_threshold:
+            state.backoff = self.base_backoff
+            state.times_opened += 1
+        else:
+            return
+
+        state.open_until = now + state.backoff
+        logger.warning(
+            f"Circuit for {source_id} open for {int(state.backoff)}s "
+            f"after {state.consecutive_failures} consecutive failures"
+        )
+
+    def get_stats(self) -> Dict:
+        now = time.monotonic()
+        stats = {}
+        for source_id, state in self.states.items():
+            if state.open_until is None:
+                status = 'closed'
+            elif state.open_until > now:
+                status = 'open'
+            else:
+                status = 'half_open'
+            stats[source_id] = {
+                'state': status,
+                'consecutive_failures': state.consecutive_failures,
+                'retry_in_seconds': max(int(state.open_until - now), 0) if state.open_until is not None else None,
+                'times_opened': state.times_opened
+            }
+        return stats
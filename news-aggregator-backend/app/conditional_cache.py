@@ -0,0 +1,78 @@
+from typing import Dict, List, Mapping, Optional
+import threading
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ConditionalGetCache:
+    """Per-URL ETag/Last-Modified validators plus the articles parsed from the last full response"""
+
+    def __init__(self):
+        self.entries: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+        self.cycle_stats = self._empty_stats()
+        self.total_stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict:
+        return {'hits': 0, 'misses': 0, 'bytes_saved': 0, 'bytes_downloaded': 0}
+
+    def start_cycle(self):
+        """Reset the per-cycle counters; totals keep accumulating"""
+        with self.lock:
+            self.cycle_stats = self._empty_stats()
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """Validator headers to send for url, empty if we have nothing to revalidate"""
+        entry = self.entries.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def hit(self, url: str) -> Optional[List[Dict]]:
+        """Record a 304 for url and return the articles parsed from the last full response"""
+        entry = self.entries.get(url)
+        if not entry:
+            return None
+
+        with self.lock:
+            for stats in (self.cycle_stats, self.total_stats):
+                stats['hits'] += 1
+                stats['bytes_saved'] += entry['content_length']
+        return list(entry['articles'])
+
+    def store(self, url: str, response_headers: Mapping[str, str], content_length: int, articles: List[Dict]):
+        """Record a full (200) response and remember its validators if the server sent any"""
+        with self.lock:
+            for stats in (self.cycle_stats, self.total_stats):
+                stats['misses'] += 1
+                stats['bytes_downloaded'] += content_length
+
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if not etag and not last_modified:
+            self.entries.pop(url, None)
+            return
+
+        self.entries[url] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_length': content_length,
+            'articles': list(articles)
+        }
+
+    def get_stats(self) -> Dict:
+        with self.lock:
+            return {
+                'tracked_urls': len(self.entries),
+                'last_cycle': dict(self.cycle_stats),
+                'total': dict(self.total_stats)
+            }
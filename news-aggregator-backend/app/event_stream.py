@@ -0,0 +1,106 @@
+from typing import AsyncIterator, Optional, Set
+import asyncio
+import logging
+
+from app.article import dumps
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Subscriber:
+    def __init__(self, max_queue: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = False
+
+
+class EventBroadcaster:
+    """
+    Fan-out of Server-Sent Events to /api/news/stream clients.
+
+    Each event is encoded once and put on every subscriber's bounded queue without waiting.
+    A subscriber whose queue is full is dropped on the spot (its stream ends with a 'dropped'
+    event), so one slow client never delays the others or grows memory.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 32,
+        max_subscribers: int = 500,
+        heartbeat_seconds: float = 15,
+        reconnect_seconds: float = 5
+    ):
+        self.max_queue = max_queue
+        self.max_subscribers = max_subscribers
+        # Comment frames keep proxies from closing idle connections
+        self.heartbeat_seconds = heartbeat_seconds
+        self.reconnect_seconds = reconnect_seconds
+        self.subscribers: Set[Subscriber] = set()
+        self.dropped_total = 0
+
+    def subscribe(self) -> Optional[Subscriber]:
+        """A new subscriber, or None when max_subscribers are already connected"""
+        if len(self.subscribers) >= self.max_subscribers:
+            return None
+        subscriber = Subscriber(self.max_queue)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+
+    @staticmethod
+    def encode(event: str, data) -> bytes:
+        return b'event: ' + event.encode('utf-8') + b'\ndata: ' + dumps(data) + b'\n\n'
+
+    def publish(self, event: str, data):
+        if not self.subscribers:
+            return
+
+        frame = self.encode(event, data)
+        for subscriber in list(self.subscribers):
+            try:
+                subscriber.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self.drop(subscriber)
+
+    def drop(self, subscriber: Subscriber):
+        self.unsubscribe(subscriber)
+        subscriber.dropped = True
+        self.dropped_total += 1
+        # Make room for the end-of-stream marker; the backlog is discarded
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(None)
+        logger.warning(f"Dropped slow event stream subscriber ({len(self.subscribers)} remaining)")
+
+    async def stream(self, subscriber: Subscriber, first_frame: Optional[bytes] = None) -> AsyncIterator[bytes]:
+        """SSE body for one subscriber; ends when it is dropped, unsubscribes when the client goes away"""
+        try:
+            yield f"retry: {int(self.reconnect_seconds * 1000)}\n\n".encode('ascii')
+            if first_frame:
+                yield first_frame
+
+            while True:
+                try:
+                    frame = await asyncio.wait_for(subscriber.queue.get(), timeout=self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield b': keepalive\n\n'
+                    continue
+
+                if frame is None:
+                    yield self.encode('dropped', {'reason': 'client too slow'})
+                    return
+                yield frame
+        finally:
+            self.unsubscribe(subscriber)
+
+    def get_stats(self):
+        return {
+            'subscribers': len(self.subscribers),
+            'dropped_total': self.dropped_total,
+            'max_queue': self.max_queue
+        }
+
+
+event_broadcaster = EventBroadcaster()
@@ -0,0 +1,160 @@
+from typing import Dict, List, Optional
+import re
+
+from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+# Raw candidate fields shared by every engine. Values are untouched page text/attributes;
+# cleaning, filtering and URL joining happen in BoiseRadioScraper.build_article.
+CANDIDATE_FIELDS = ('title', 'link', 'description', 'image', 'date')
+
+
+def parse_document(content: bytes) -> Optional[etree._Element]:
+    """Parse a page into an lxml tree once so several lxml-based extractors can share it"""
+    if not content or not content.strip():
+        return None
+    return lxml_html.document_fromstring(content)
+
+
+def first_value(result) -> Optional[str]:
+    """Normalize an XPath result (node-set, attribute/text list or string) to a single string"""
+    if isinstance(result, list):
+        if not result:
+            return None
+        result = result[0]
+    if isinstance(result, etree._Element):
+        return result.text_content()
+    return str(result) if result else None
+
+
+class SoupExtractor:
+    """Generic heuristics over a BeautifulSoup html.parser tree"""
+
+    name = 'soup'
+
+    item_class = re.compile(r'post|article|entry|item|card')
+    title_class = re.compile(r'title|headline|entry-title')
+    description_class = re.compile(r'excerpt|summary|description')
+    date_class = re.compile(r'date|time|published')
+
+    def extract(self, content: bytes, max_items: int = 10, tree=None) -> List[Dict[str, Optional[str]]]:
+        soup = BeautifulSoup(content, 'html.parser')
+        candidates = []
+
+        for element in soup.find_all(['article', 'div'], class_=self.item_class)[:max_items]:
+            title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'a'], class_=self.title_class)
+            link_elem = element.find('a', href=True)
+            desc_elem = element.find(['p', 'div'], class_=self.description_class)
+            img_elem = element.find('img', src=True)
+            date_elem = element.find(['time', 'span'], class_=self.date_class)
+
+            candidates.append({
+                'title': title_elem.get_text() if title_elem else None,
+                'link': link_elem['href'] if link_elem else None,
+                'description': desc_elem.get_text() if desc_elem else None,
+                'image': img_elem['src'] if img_elem else None,
+                'date': (date_elem.get('datetime') or date_elem.get_text()) if date_elem else None
+            })
+
+        return candidates
+
+
+class LxmlExtractor:
+    """The same heuristics as SoupExtractor, as precompiled XPath over an lxml tree"""
+
+    name = 'lxml'
+
+    namespaces = {'re': 'http://exslt.org/regular-expressions'}
+
+    items = etree.XPath(
+        "//*[self::article or self::div][re:test(@class, 'post|article|entry|item|card')]",
+        namespaces=namespaces
+    )
+    title = etree.XPath(
+        "(.//*[self::h1 or self::h2 or self::h3 or self::h4 or self::a]"
+        "[re:test(@class, 'title|headline|entry-title')])[1]",
+        namespaces=namespaces
+    )
+    link = etree.XPath("(.//a[@href])[1]/@href")
+    description = etree.XPath(
+        "(.//*[self::p or self::div][re:test(@class, 'excerpt|summary|description')])[1]",
+        namespaces=namespaces
+    )
+    image = etree.XPath("(.//img[@src])[1]/@src")
+    date = etree.XPath(
+        "(.//*[self::time or self::span][re:test(@class, 'date|time|published')])[1]",
+        namespaces=namespaces
+    )
+
+    def extract(self, content: bytes, max_items: int = 10, tree=None) -> List[Dict[str, Optional[str]]]:
+        if tree is None:
+            tree = parse_document(content)
+        if tree is None:
+            return []
+
+        candidates = []
+
+        for element in self.items(tree)[:max_items]:
+            date_nodes = self.date(element)
+            date_value = None
+            if date_nodes:
+                date_value = date_nodes[0].get('datetime') or date_nodes[0].text_content()
+
+            candidates.append({
+                'title': first_value(self.title(element)),
+                'link': first_value(self.link(element)),
+                'description': first_value(self.description(element)),
+                'image': first_value(self.image(element)),
+                'date': date_value
+            })
+
+        return candidates
+
+
+class ProfileExtractor:
+    """
+    Station-specific XPath selectors, compiled once when the scraper starts.
+    A profile needs 'item' and 'title'; 'link', 'description', 'image', 'date' and
+    'date_format' (strptime format for the extracted date) are optional.
+    Field selectors are evaluated relative to each item.
+    """
+
+    name = 'profile'
+
+    def __init__(self, profile: Dict[str, str]):
+        self.items = etree.XPath(profile['item'])
+        self.fields = {
+            field: etree.XPath(profile[field])
+            for field in CANDIDATE_FIELDS
+            if profile.get(field)
+        }
+        self.date_format = profile.get('date_format')
+
+    def extract(self, content: bytes, max_items: int = 10, tree=None) -> List[Dict[str, Optional[str]]]:
+        if tree is None:
+            tree = parse_document(content)
+        if tree is None:
+            return []
+
+        candidates = []
+        for element in self.items(tree)[:max_items]:
+            candidate = dict.fromkeys(CANDIDATE_FIELDS)
+            for field, xpath in self.fields.items():
+                candidate[field] = first_value(xpath(element))
+            candidates.append(candidate)
+
+        return candidates
+
+
+EXTRACTORS = {
+    SoupExtractor.name: SoupExtractor(),
+    LxmlExtractor.name: LxmlExtractor(),
+}
+
+
+def get_extractor(name: str):
+    try:
+        return EXTRACTORS[name]
+    except KeyError:
+        raise ValueError(f"Unknown extraction engine: {name}")
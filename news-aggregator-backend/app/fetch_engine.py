@@ -0,0 +1,38 @@
+from typing import Any, Awaitable, Callable, Optional, Set
+import asyncio
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class FetchEngine:
+    """Run per-source fetch jobs concurrently under a global limit and per-source timeout"""
+
+    def __init__(self, max_concurrency: int = 5, source_timeout: float = 30):
+        self.max_concurrency = max_concurrency
+        self.source_timeout = source_timeout
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        # Jobs holding a slot; the rest of the callers are still queued on the semaphore
+        self.running: Set[str] = set()
+
+    async def fetch(self, job_id: str, job: Callable[[], Awaitable[Any]], default: Any = None) -> Any:
+        """
+        Await a single job under the shared concurrency limit.
+        A job that raises or exceeds source_timeout yields `default`.
+        """
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self.semaphore:
+            self.running.add(job_id)
+            try:
+                return await asyncio.wait_for(job(), timeout=self.source_timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Timed out fetching {job_id} after {self.source_timeout}s")
+            except Exception as e:
+                logger.error(f"Error fetching {job_id}: {e}")
+            finally:
+                self.running.discard(job_id)
+            return default
+
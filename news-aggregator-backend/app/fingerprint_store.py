@@ -0,0 +1,145 @@
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+
+from app.article_store import canonical_url
+from app.timestamps import set_published
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Arrays are written in native byte order; the file is local to the host that wrote it
+FILE_MAGIC = b'FPS1'
+HEADER = struct.Struct('=4sQ')
+
+
+class FingerprintStore:
+    """
+    Cross-cycle record of every article seen, as 64-bit fingerprints with first/last-seen
+    times in three parallel sorted arrays (24 bytes per article). Entries not seen for
+    ttl_days expire; beyond max_entries the least recently seen are evicted.
+    New fingerprints collect in a small pending dict and are merged in batches.
+    """
+
+    def __init__(self, path: str, ttl_days: int = 30, max_entries: int = 200_000, merge_batch: int = 4096):
+        self.path = path
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self.merge_batch = merge_batch
+        self.keys = array('Q')
+        self.first_seen = array('Q')
+        self.last_seen = array('Q')
+        self.pending: Dict[int, List[int]] = {}
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys) + len(self.pending)
+
+    @staticmethod
+    def fingerprint(source_id: str, article: Dict) -> int:
+        identity = f"{source_id}\x00{canonical_url(article.get('url', ''))}\x00{article.get('title', '').strip().lower()}"
+        return int.from_bytes(hashlib.blake2b(identity.encode('utf-8'), digest_size=8).digest(), 'little')
+
+    def observe(self, fingerprint: int, now: Optional[int] = None) -> int:
+        """Record a sighting and return when the fingerprint was first seen (epoch seconds)"""
+        now = int(now if now is not None else time.time())
+        with self.lock:
+            index = bisect_left(self.keys, fingerprint)
+            if index < len(self.keys) and self.keys[index] == fingerprint:
+                self.last_seen[index] = now
+                return self.first_seen[index]
+
+            entry = self.pending.get(fingerprint)
+            if entry is not None:
+                entry[1] = now
+                return entry[0]
+
+            self.pending[fingerprint] = [now, now]
+            if len(self.pending) >= self.merge_batch:
+                self._merge(now)
+            return now
+
+    def stamp(self, source_id: str, articles: List[Dict], now: Optional[int] = None) -> List[Dict]:
+        """Record every article; undated ones get their first-seen time as 'published'"""
+        for article in articles:
+            first_seen = self.observe(self.fingerprint(source_id, article), now)
+            if not article.get('published'):
+                set_published(article, datetime.fromtimestamp(first_seen, timezone.utc))
+        return articles
+
+    def _merge(self, now: int):
+        """Fold pending entries into the sorted arrays, expiring and evicting on the way (lock held)"""
+        expiry = now - self.ttl_days * 86400
+        rows = [
+            row for row in zip(self.keys, self.first_seen, self.last_seen)
+            if row[2] >= expiry and row[0] not in self.pending
+        ]
+        rows.extend((key, first, last) for key, (first, last) in self.pending.items() if last >= expiry)
+
+        if len(rows) > self.max_entries:
+            rows.sort(key=lambda row: row[2], reverse=True)
+            del rows[self.max_entries:]
+        rows.sort()
+
+        self.keys = array('Q', (row[0] for row in rows))
+        self.first_seen = array('Q', (row[1] for row in rows))
+        self.last_seen = array('Q', (row[2] for row in rows))
+        self.pending = {}
+
+    def load(self):
+        """Read the persisted fingerprints; a missing or unreadable file starts an empty store"""
+        try:
+            with open(self.path, 'rb') as f:
+                magic, count = HEADER.unpack(f.read(HEADER.size))
+                if magic != FILE_MAGIC:
+                    raise ValueError(f"unexpected file header {magic!r}")
+                columns = []
+                for _ in range(3):
+                    column = array('Q')
+                    column.fromfile(f, count)
+                    columns.append(column)
+        except FileNotFoundError:
+            logger.info(f"No fingerprint file at {self.path}, starting empty")
+            return
+        except Exception as e:
+            logger.error(f"Error loading fingerprints from {self.path}: {e}")
+            return
+
+        with self.lock:
+            self.keys, self.first_seen, self.last_seen = columns
+            self._merge(int(time.time()))
+        logger.info(f"Loaded {len(self.keys)} article fingerprints")
+
+    def save(self):
+        """Merge, expire and write the store atomically (blocking; call from a thread)"""
+        with self.lock:
+            self._merge(int(time.time()))
+            data = HEADER.pack(FILE_MAGIC, len(self.keys)) + b''.join(
+                column.tobytes() for column in (self.keys, self.first_seen, self.last_seen)
+            )
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, self.path)
+
+    def get_stats(self) -> Dict:
+        return {
+            'entries': len(self),
+            'bytes': len(self.keys) * 3 * self.keys.itemsize,
+            'ttl_days': self.ttl_days,
+            'max_entries': self.max_entries
+        }
+
+
+fingerprint_store = FingerprintStore(os.environ.get('FINGERPRINT_PATH', 'data/fingerprints.bin'))
@@ -0,0 +1,34 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+from urllib.parse import urlsplit
+import asyncio
+import random
+
+
+class HostScheduler:
+    """
+    Politeness scheduler: requests to the same host run one at a time with a randomized
+    delay between them, while requests to different hosts proceed in parallel.
+    """
+
+    def __init__(self, min_delay: float = 0.5, max_delay: float = 1.5):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.host_locks: Dict[str, asyncio.Lock] = {}
+        self.next_allowed: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold the host's slot for url, waiting out the delay left by the previous request"""
+        host = urlsplit(url).netloc.lower()
+        lock = self.host_locks.setdefault(host, asyncio.Lock())
+        loop = asyncio.get_running_loop()
+
+        async with lock:
+            wait = self.next_allowed.get(host, 0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                yield
+            finally:
+                self.next_allowed[host] = loop.time() + random.uniform(self.min_delay, self.max_delay)
@@ -0,0 +1,86 @@
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import asyncio
+import logging
+
+import httpx
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+class HTTPClient:
+    """
+    Shared keep-alive HTTP client used by the RSS aggregator and the radio scraper.
+    Connections are pooled across the whole process, and each host is capped at
+    max_connections_per_host in-flight requests.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_connections_per_host: int = 4,
+        keepalive_expiry: float = 30,
+        http2: bool = True,
+        timeout: float = 30
+    ):
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.timeout = timeout
+        self.client: Optional[httpx.AsyncClient] = None
+        self.host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def start(self):
+        if self.client is not None:
+            return
+
+        self.client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            http2=self.http2,
+            follow_redirects=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=self.keepalive_expiry
+            )
+        )
+        logger.info(f"Shared HTTP client started (http2={self.http2}, max_connections={self.max_connections})")
+
+    async def close(self):
+        if self.client is None:
+            return
+
+        await self.client.aclose()
+        self.client = None
+        self.host_semaphores.clear()
+        logger.info("Shared HTTP client closed")
+
+    def get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        semaphore = self.host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self.host_semaphores[host] = semaphore
+        return semaphore
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> httpx.Response:
+        """GET url through the shared pool; the body is fully read before the host slot is released"""
+        if self.client is None:
+            await self.start()
+
+        async with self.get_host_semaphore(url):
+            return await self.client.get(
+                url,
+                headers=headers,
+                timeout=timeout if timeout is not None else self.timeout
+            )
+
+
+http_client = HTTPClient()
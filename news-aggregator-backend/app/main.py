@@ -1,13 +1,30 @@
-from fastapi import FastAPI, BackgroundTasks
+from fastapi import FastAPI, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
 import asyncio
 import logging
+import time
 
+from app.article import Article, dumps
 from app.rss_aggregator import RSSAggregator
 from app.radio_scraper import BoiseRadioScraper
-from app.aggregator_service import AggregatorService
+from app.article_store import article_store
 from app.cache_manager import cache_manager
+from app.circuit_breaker import CircuitBreaker
+from app.event_stream import event_broadcaster
+from app.fingerprint_store import fingerprint_store
+from app.http_client import http_client
+from app.metrics import pipeline_metrics
+from app.parse_pool import parse_pool
+from app.rate_limiter import RateLimiter
+from app.refresh_scheduler import RefreshScheduler
+from app.shared_state import shared_state
+from app.news_index import decode_cursor, encode_cursor
+from app.timestamps import ensure_published_ts, to_utc
+from app.tracer import tracer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,74 +32,426 @@ logger = logging.getLogger(__name__)
 rss_aggregator = RSSAggregator()
 radio_scraper = BoiseRadioScraper()
 
+# ?fresh=1 re-fetches every source of a kind, so allow it at most once per 5 minutes per kind
+fresh_limiter = RateLimiter(min_interval_seconds=300)
 
-async def update_news_cache():
-    if cache_manager.is_updating:
-        logger.info("Update already in progress, skipping")
+# Each source is re-fetched on its own adaptive interval (15 minutes to 12 hours)
+refresh_scheduler = RefreshScheduler()
+
+# Sources failing 3 times in a row are skipped, then probed after 5 min, 10 min, ... up to 6 h
+source_breakers = CircuitBreaker()
+
+# A refresh waits at most this long for its sources; the rest keep their last known articles.
+# Feeds (source_timeout) and stations (station_timeout) give up after 20 s, so they fail on their own first
+CYCLE_DEADLINE_SECONDS = 25
+
+
+async def refresh_source(source_id: str) -> bool:
+    """Fetch one source and merge its delta into the cache; on failure its last known articles stay"""
+    kind = 'national' if source_id in rss_aggregator.sources else 'local'
+    with tracer.span('fetch', track=source_id, kind=kind):
+        started = time.perf_counter()
+        if kind == 'national':
+            articles = await rss_aggregator.fetch_source(source_id)
+        else:
+            articles = await radio_scraper.scrape_station(source_id)
+        pipeline_metrics.refresh_seconds.observe(time.perf_counter() - started, source=source_id, kind=kind)
+    
+    refresh_scheduler.record(source_id, articles)
+    if articles is None:
+        source_breakers.record_failure(source_id)
+        pipeline_metrics.fetches.inc(source=source_id, outcome='failed')
+        logger.warning(f"Refresh of {source_id} failed, keeping its last known articles")
+        return False
+    
+    source_breakers.record_success(source_id)
+    pipeline_metrics.fetches.inc(source=source_id, outcome='ok')
+    pipeline_metrics.articles_kept.inc(len(articles), source=source_id)
+    with tracer.span('merge', track=source_id) as span:
+        added, removed = await cache_manager.apply_source_update(source_id, kind, articles)
+        span.update(added=len(added), removed=len(removed))
+    
+    try:
+        with tracer.span('persist', track=source_id):
+            await asyncio.to_thread(article_store.save_source, source_id, kind, articles)
+    except Exception as e:
+        logger.error(f"Error persisting articles for {source_id}: {e}")
+    
+    return True
+
+
+async def refresh_sources(source_ids: List[str]) -> List[bool]:
+    """
+    Refresh sources concurrently until CYCLE_DEADLINE_SECONDS. Sources with an open circuit
+    are skipped and unfinished ones are cancelled; both keep their last known articles.
+    Only a source whose fetch had started counts the deadline as a failure.
+    Returns whether each source was refreshed, in order.
+    """
+    tasks = {}
+    for source_id in source_ids:
+        retry_in = source_breakers.retry_in(source_id)
+        if retry_in is None:
+            tasks[source_id] = asyncio.create_task(refresh_source(source_id))
+        else:
+            refresh_scheduler.postpone(source_id, retry_in)
+            pipeline_metrics.fetches.inc(source=source_id, outcome='circuit_open')
+    
+    started = set()
+    try:
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=CYCLE_DEADLINE_SECONDS)
+    finally:
+        unfinished = {source_id: task for source_id, task in tasks.items() if not task.done()}
+        # Stations start right away; feeds may still be queued for a FetchEngine slot
+        started = {
+            source_id for source_id in unfinished
+            if source_id not in rss_aggregator.sources or rss_aggregator.is_fetching(source_id)
+        }
+        for task in unfinished.values():
+            task.cancel()
+        await asyncio.gather(*unfinished.values(), return_exceptions=True)
+    
+    results = []
+    for source_id in source_ids:
+        task = tasks.get(source_id)
+        if task is None:
+            results.append(False)
+        elif task.cancelled() and source_id not in started:
+            # Never got to fetch: not the source's fault, and it stays due for the next batch
+            logger.warning(f"{source_id} was still queued at the {CYCLE_DEADLINE_SECONDS}s cycle deadline")
+            pipeline_metrics.fetches.inc(source=source_id, outcome='queued')
+            results.append(False)
+        elif task.cancelled():
+            logger.warning(f"{source_id} missed the {CYCLE_DEADLINE_SECONDS}s cycle deadline, keeping its last known articles")
+            refresh_scheduler.record(source_id, None)
+            source_breakers.record_failure(source_id)
+            pipeline_metrics.fetches.inc(source=source_id, outcome='deadline')
+            results.append(False)
+        elif task.exception() is not None:
+            logger.error(f"Error refreshing {source_id}: {task.exception()}")
+            results.append(False)
+        else:
+            results.append(task.result())
+    
+    skipped = len(source_ids) - len(tasks)
+    if skipped:
+        logger.info(f"Skipped {skipped} sources with an open circuit")
+    return results
+
+
+def recency_cutoffs() -> Dict[str, int]:
+    """Oldest published_ts each kind keeps, the same rules the fetchers apply"""
+    return {
+        'national': rss_aggregator.cutoff_ts(),
+        'local': radio_scraper.cutoff_ts()
+    }
+
+
+async def publish_snapshot(last_updated: Optional[datetime] = None, version: Optional[int] = None) -> Dict:
+    with tracer.span('publish'):
+        merged_results = await cache_manager.publish(
+            local_filter=lambda articles: radio_scraper.apply_diversity_filter(articles, window_size=10, max_per_station=2),
+            max_results=50,
+            last_updated=last_updated,
+            version=version,
+            cutoffs=recency_cutoffs()
+        )
+    if shared_state.enabled and shared_state.is_leader:
+        with tracer.span('write_shared_snapshot'):
+            await write_shared_snapshot()
+    return merged_results
+
+
+async def write_shared_snapshot():
+    try:
+        await asyncio.to_thread(
+            shared_state.write_snapshot,
+            cache_manager.version,
+            cache_manager.cache['last_updated'],
+            cache_manager.export_sources()
+        )
+    except Exception as e:
+        logger.error(f"Error writing shared snapshot: {e}")
+
+
+async def sync_shared_snapshot():
+    """Follower: apply the updater's latest snapshot if the file changed since the last read"""
+    if not shared_state.changed():
         return
     
     try:
-        cache_manager.is_updating = True
-        logger.info("Starting news aggregation update...")
-        
-        national_articles = await rss_aggregator.aggregate_all()
-        logger.info(f"Fetched {len(national_articles)} national articles")
-        
-        local_articles = await radio_scraper.scrape_all_stations()
-        logger.info(f"Scraped {len(local_articles)} local radio articles")
-        
-        merged_results = AggregatorService.merge_and_process(
-            national_articles,
-            local_articles,
-            max_results=50
+        snapshot = await asyncio.to_thread(shared_state.read_snapshot)
+    except Exception as e:
+        logger.error(f"Error reading shared snapshot: {e}")
+        return
+    
+    if not snapshot or snapshot['version'] <= cache_manager.version:
+        return
+    
+    # Unchanged articles compare equal, so only each source's real delta touches the merged view
+    sources = snapshot['sources']
+    for source_id, state in sources.items():
+        await cache_manager.apply_source_update(
+            source_id,
+            state['kind'],
+            [Article.from_dict(article) for article in state['articles']],
+            refreshed_at=datetime.fromisoformat(state['refreshed_at'])
         )
-        
-        await cache_manager.set_cached_results(
-            national_articles,
-            local_articles,
-            merged_results
+    for source_id in set(cache_manager.sources) - set(sources):
+        await cache_manager.apply_source_update(source_id, cache_manager.sources[source_id]['kind'], [])
+    
+    await publish_snapshot(last_updated=datetime.fromisoformat(snapshot['last_updated']), version=snapshot['version'])
+    logger.info(f"Loaded shared snapshot version {snapshot['version']}")
+
+
+async def restore_from_store():
+    """Serve the last persisted snapshot right away instead of waiting for a cold fetch"""
+    try:
+        await asyncio.to_thread(article_store.open)
+        snapshot = await asyncio.to_thread(article_store.load_snapshot)
+    except Exception as e:
+        logger.error(f"Error loading persisted articles: {e}")
+        return
+    
+    if not snapshot:
+        logger.info("No persisted articles found")
+        return
+    
+    known_sources = set(rss_aggregator.sources) | set(radio_scraper.stations)
+    restored = {source_id: state for source_id, state in snapshot.items() if source_id in known_sources}
+    # A store written days ago would otherwise bring back articles the fetchers no longer keep
+    cutoffs = recency_cutoffs()
+    for source_id, state in restored.items():
+        articles = [Article.from_dict(ensure_published_ts(article)) for article in state['articles']]
+        await cache_manager.apply_source_update(
+            source_id,
+            state['kind'],
+            [article for article in articles if article.published_ts >= cutoffs[state['kind']]],
+            refreshed_at=datetime.fromisoformat(state['updated_at'])
         )
-        
-        logger.info(f"News cache updated successfully. Total articles: {merged_results['total_count']}")
-        
+    
+    if restored:
+        last_updated = max(datetime.fromisoformat(state['updated_at']) for state in restored.values())
+        merged_results = await publish_snapshot(last_updated=last_updated)
+        logger.info(f"Restored {merged_results['total_count']} articles from {len(restored)} persisted sources")
+
+
+async def save_fingerprints():
+    if not shared_state.is_leader:
+        return
+    try:
+        with tracer.span('save_fingerprints'):
+            await asyncio.to_thread(fingerprint_store.save)
     except Exception as e:
-        logger.error(f"Error updating news cache: {e}")
-    finally:
-        cache_manager.is_updating = False
+        logger.error(f"Error saving article fingerprints: {e}")
+
+
+async def update_news_cache():
+    """One full refresh cycle; always run it through cache_manager.refresh/start_refresh (single-flight)"""
+    if not shared_state.is_leader:
+        # Another worker fetches; pick up its latest snapshot instead
+        await sync_shared_snapshot()
+        return
+    
+    with tracer.cycle('full') as trace:
+        try:
+            logger.info("Starting news aggregation update...")
+            
+            rss_aggregator.conditional_cache.start_cycle()
+            source_ids = list(rss_aggregator.sources) + list(radio_scraper.stations)
+            
+            # Every source refreshes independently and only its delta touches the merged view
+            results = await refresh_sources(source_ids)
+            logger.info(f"Refreshed {sum(results)}/{len(source_ids)} sources")
+            
+            merged_results = await publish_snapshot()
+            await save_fingerprints()
+            
+            logger.info(f"News cache updated successfully. Total articles: {merged_results['total_count']}")
+            
+        except Exception as e:
+            logger.error(f"Error updating news cache: {e}")
+    
+    pipeline_metrics.cycle_seconds.observe(trace.duration, cycle='full')
+
+
+async def refresh_kind(kind: str):
+    """Refresh only the national (RSS) or local (station) sources, then republish the snapshot"""
+    if not shared_state.is_leader:
+        await sync_shared_snapshot()
+        return
+    
+    with tracer.cycle(kind) as trace:
+        try:
+            if kind == 'national':
+                rss_aggregator.conditional_cache.start_cycle()
+                source_ids = list(rss_aggregator.sources)
+            else:
+                source_ids = list(radio_scraper.stations)
+            
+            results = await refresh_sources(source_ids)
+            logger.info(f"Refreshed {sum(results)}/{len(source_ids)} {kind} sources")
+            
+            await publish_snapshot()
+            await save_fingerprints()
+            
+        except Exception as e:
+            logger.error(f"Error refreshing {kind} sources: {e}")
+    
+    pipeline_metrics.cycle_seconds.observe(trace.duration, cycle=kind)
+
+
+async def refresh_due_sources():
+    """Fetch the sources whose scheduled refresh is due (or nearly); republish only if articles changed"""
+    source_ids = refresh_scheduler.due(list(rss_aggregator.sources) + list(radio_scraper.stations), within=60)
+    if not source_ids:
+        return
+    
+    with tracer.cycle('scheduled') as trace:
+        try:
+            if any(source_id in rss_aggregator.sources for source_id in source_ids):
+                rss_aggregator.conditional_cache.start_cycle()
+            
+            results = await refresh_sources(source_ids)
+            logger.info(f"Scheduled refresh: {sum(results)}/{len(source_ids)} sources ({', '.join(source_ids)})")
+            
+            # Failing sources' retained articles still expire on schedule
+            await cache_manager.expire(recency_cutoffs())
+            
+            # 304s and unchanged sets keep the current version (same ETag, no stream event, no shared write)
+            if cache_manager.has_unpublished_changes:
+                await publish_snapshot()
+            else:
+                logger.info("Scheduled refresh changed no articles, keeping the current version")
+            await save_fingerprints()
+            
+        except Exception as e:
+            logger.error(f"Error in scheduled source refresh: {e}")
+    
+    pipeline_metrics.cycle_seconds.observe(trace.duration, cycle='scheduled')
+
+
+async def get_partition_response(
+    kind: str,
+    fresh: bool = False,
+    article_filter: Optional[Callable[[Article], bool]] = None
+):
+    """Serve one kind's articles from the cache; fresh=True forces a (rate-limited) refresh first"""
+    if fresh:
+        retry_after = fresh_limiter.try_acquire(kind)
+        if retry_after is not None:
+            return JSONResponse(
+                status_code=429,
+                headers={'Retry-After': str(int(retry_after) + 1)},
+                content={
+                    'success': False,
+                    'error': f'Fresh {kind} fetches are rate limited, retry in {int(retry_after) + 1}s',
+                    'articles': []
+                }
+            )
+        # Joins an in-flight full cycle or refresh of this kind; waits out any other refresh, then runs its own
+        await cache_manager.refresh(lambda: refresh_kind(kind), scope=kind)
+    
+    partition = await cache_manager.get_partition(kind)
+    
+    if partition is None:
+        logger.info("No cache available, fetching fresh data...")
+        await cache_manager.refresh(update_news_cache)
+        partition = await cache_manager.get_partition(kind)
+    elif not fresh and cache_manager.is_stale():
+        cache_manager.start_refresh(update_news_cache)
+    
+    if partition is None:
+        return {
+            'success': False,
+            'error': 'Failed to fetch news data',
+            'articles': []
+        }
+    
+    articles = partition['articles']
+    if article_filter:
+        articles = [article for article in articles if article_filter(article)]
+    
+    # Articles are encoded directly (no jsonable_encoder pass over every dataclass)
+    return Response(
+        content=dumps({
+            'success': True,
+            'count': len(articles),
+            'articles': articles,
+            'last_updated': partition['last_updated']
+        }),
+        media_type='application/json'
+    )
 
 
 async def periodic_update_task():
     # Initial update on startup
     logger.info("Performing initial cache population on startup...")
-    await update_news_cache()
+    await cache_manager.refresh(update_news_cache)
     
+    source_ids = list(rss_aggregator.sources) + list(radio_scraper.stations)
     while True:
         try:
-            if cache_manager.should_update():
-                logger.info("Starting scheduled news update...")
-                await update_news_cache()
-            else:
-                logger.info("Cache is still fresh, skipping update")
-            
-            await asyncio.sleep(21600)  # 6 hours = 21600 seconds
+            # Wake for the next due source; re-check at least every minute (manual refreshes reschedule)
+            await asyncio.sleep(min(refresh_scheduler.seconds_until_due(source_ids), 60))
+            if refresh_scheduler.due(source_ids, within=60):
+                await cache_manager.refresh(refresh_due_sources, scope='scheduled')
             
         except Exception as e:
             logger.error(f"Error in periodic update task: {e}")
             await asyncio.sleep(600)
 
 
+async def shared_state_task():
+    """Multi-worker mode: follow the shared snapshot until this worker takes the updater lock"""
+    while True:
+        try:
+            if shared_state.try_become_leader():
+                # Continue from the previous updater's fingerprints, articles and version number
+                await asyncio.to_thread(fingerprint_store.load)
+                await sync_shared_snapshot()
+                await restore_from_store()
+                await periodic_update_task()
+            elif shared_state.changed():
+                await cache_manager.refresh(sync_shared_snapshot, scope='sync')
+        except Exception as e:
+            logger.error(f"Error in shared state task: {e}")
+        
+        await asyncio.sleep(shared_state.poll_seconds)
+
+
 background_tasks_started = False
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting up application...")
     
-    periodic_task = asyncio.create_task(periodic_update_task())
+    await http_client.start()
+    parse_pool.start()
+    if shared_state.enabled:
+        periodic_task = asyncio.create_task(shared_state_task())
+    else:
+        await asyncio.to_thread(fingerprint_store.load)
+        await restore_from_store()
+        periodic_task = asyncio.create_task(periodic_update_task())
     
     yield
     
     logger.info("Shutting down application...")
     periodic_task.cancel()
+    if cache_manager.refresh_task:
+        cache_manager.refresh_task.cancel()
+    for task in (periodic_task, cache_manager.refresh_task):
+        try:
+            if task:
+                await task
+        except asyncio.CancelledError:
+            pass
+    await http_client.close()
+    parse_pool.shutdown()
+    await save_fingerprints()
+    await asyncio.to_thread(article_store.close)
+    shared_state.release()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -102,38 +471,160 @@ async def healthz():
     return {"status": "ok"}
 
 
-@app.get("/api/news")
-async def get_news():
-    cached_results = await cache_manager.get_cached_results()
+def parse_since(since: str) -> int:
+    """`since` as epoch seconds or an ISO 8601 datetime (naive means UTC)"""
+    if since.lstrip('-').isdigit():
+        return int(since)
+    return int(to_utc(datetime.fromisoformat(since)).timestamp())
+
+
+async def query_news(
+    source: Optional[str],
+    content_type: Optional[str],
+    since: Optional[str],
+    limit: int,
+    cursor: Optional[str]
+):
+    """Filtered, cursor-paginated slice of the full deduplicated article set"""
+    try:
+        since_ts = parse_since(since) if since else None
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={'success': False, 'error': str(e), 'articles': []})
     
-    if cached_results:
-        return cached_results
+    news_index = cache_manager.get_news_index()
+    if news_index is None:
+        logger.info("No cache available, fetching fresh data...")
+        await cache_manager.refresh(update_news_cache)
+        news_index = cache_manager.get_news_index()
+    elif cache_manager.is_stale():
+        cache_manager.start_refresh(update_news_cache)
     
-    logger.info("No cache available, fetching fresh data...")
-    await update_news_cache()
+    if news_index is None:
+        return {
+            'success': False,
+            'error': 'Failed to fetch news data',
+            'articles': []
+        }
     
-    cached_results = await cache_manager.get_cached_results()
+    articles, next_after, total = news_index.page(source, content_type, since_ts, after, limit)
+    return Response(
+        content=dumps({
+            'success': True,
+            'count': len(articles),
+            'total_count': total,
+            'articles': articles,
+            'next_cursor': encode_cursor(next_after) if next_after else None,
+            'last_updated': cache_manager.cache['last_updated'].isoformat()
+        }),
+        media_type='application/json'
+    )
+
+
+@app.get("/api/news")
+async def get_news(
+    request: Request,
+    source: Optional[str] = None,
+    content_type: Optional[str] = None,
+    since: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None
+):
+    if any(param is not None for param in (source, content_type, since, limit, cursor)):
+        return await query_news(source, content_type, since, limit or 50, cursor)
     
-    if cached_results:
-        return cached_results
-    else:
+    snapshot = cache_manager.get_rendered_snapshot()
+    
+    if snapshot is None:
+        # Nothing servable (cold start or past the hard-staleness limit): join the in-flight refresh
+        logger.info("No cache available, fetching fresh data...")
+        await cache_manager.refresh(update_news_cache)
+        snapshot = cache_manager.get_rendered_snapshot()
+    elif cache_manager.is_stale():
+        # Stale-while-revalidate: answer now, refresh in the background (at most one refresh at a time)
+        cache_manager.start_refresh(update_news_cache)
+    
+    if snapshot is None:
         return {
             'success': False,
             'error': 'Failed to fetch news data',
             'articles': []
         }
+    
+    # The body was serialized and compressed once when this version was cached
+    age = datetime.now() - snapshot.last_updated
+    headers = {
+        'Age': str(int(age.total_seconds())),
+        'X-Cache-Status': 'stale' if cache_manager.is_stale() else 'fresh',
+        'ETag': snapshot.etag,
+        'Vary': 'Accept-Encoding'
+    }
+    
+    if request.headers.get('if-none-match') == snapshot.etag:
+        return Response(status_code=304, headers=headers)
+    
+    encoding = snapshot.choose_encoding(request.headers.get('accept-encoding'))
+    if encoding != 'identity':
+        headers['Content-Encoding'] = encoding
+    
+    return Response(content=snapshot.bodies[encoding], media_type='application/json', headers=headers)
 
 
-@app.get("/api/news/national")
-async def get_national_news():
-    try:
-        articles = await rss_aggregator.aggregate_all()
-        
-        return {
+@app.get("/api/news/search")
+async def search_news(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    prefix: bool = True
+):
+    """Full-text search over every cached article's title and description, newest first"""
+    if cache_manager.get_snapshot_age() is None:
+        logger.info("No cache available, fetching fresh data...")
+        await cache_manager.refresh(update_news_cache)
+    elif cache_manager.is_stale():
+        cache_manager.start_refresh(update_news_cache)
+    
+    articles, total = cache_manager.search_index.search(q, limit=limit, prefix=prefix)
+    return Response(
+        content=dumps({
             'success': True,
+            'query': q,
             'count': len(articles),
+            'total_count': total,
             'articles': articles
-        }
+        }),
+        media_type='application/json'
+    )
+
+
+@app.get("/api/news/stream")
+async def stream_news():
+    """
+    Server-Sent Events: 'articles' (newly visible articles) and 'version' (a new snapshot is
+    available at /api/news) whenever the cache is updated. Slow clients are disconnected.
+    """
+    subscriber = event_broadcaster.subscribe()
+    if subscriber is None:
+        return JSONResponse(
+            status_code=503,
+            headers={'Retry-After': '30'},
+            content={'success': False, 'error': 'Too many stream subscribers'}
+        )
+    
+    # The current version first, so a client knows whether its copy is already up to date
+    snapshot = cache_manager.get_rendered_snapshot()
+    first_frame = event_broadcaster.encode('version', cache_manager.version_event(snapshot)) if snapshot else None
+    
+    return StreamingResponse(
+        event_broadcaster.stream(subscriber, first_frame),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.get("/api/news/national")
+async def get_national_news(fresh: bool = False):
+    try:
+        return await get_partition_response('national', fresh)
     except Exception as e:
         logger.error(f"Error fetching national news: {e}")
         return {
@@ -144,15 +635,9 @@ async def get_national_news():
 
 
 @app.get("/api/news/local")
-async def get_local_news():
+async def get_local_news(fresh: bool = False):
     try:
-        articles = await radio_scraper.scrape_all_stations()
-        
-        return {
-            'success': True,
-            'count': len(articles),
-            'articles': articles
-        }
+        return await get_partition_response('local', fresh)
     except Exception as e:
         logger.error(f"Error fetching local news: {e}")
         return {
@@ -166,24 +651,7 @@ async def get_local_news():
 async def get_broadcasting_news():
     """Get national broadcasting industry trade publication news only"""
     try:
-        cached_results = await cache_manager.get_cached_results()
-        
-        if cached_results and cached_results.get('success'):
-            national_articles = cached_results.get('national_articles', [])
-            return {
-                'success': True,
-                'count': len(national_articles),
-                'articles': national_articles,
-                'last_updated': cached_results.get('last_updated')
-            }
-        
-        articles = await rss_aggregator.aggregate_all()
-        
-        return {
-            'success': True,
-            'count': len(articles),
-            'articles': articles
-        }
+        return await get_partition_response('national')
     except Exception as e:
         logger.error(f"Error fetching broadcasting news: {e}")
         return {
@@ -197,28 +665,10 @@ async def get_broadcasting_news():
 async def get_radio_station_news():
     """Get Boise radio station-specific content only (events, contests, podcasts, etc.)"""
     try:
-        cached_results = await cache_manager.get_cached_results()
-        
-        if cached_results and cached_results.get('success'):
-            local_articles = cached_results.get('local_articles', [])
-            station_specific = [
-                article for article in local_articles 
-                if radio_scraper.is_station_specific_content(article.get('content_type', ''))
-            ]
-            return {
-                'success': True,
-                'count': len(station_specific),
-                'articles': station_specific,
-                'last_updated': cached_results.get('last_updated')
-            }
-        
-        articles = await radio_scraper.scrape_all_stations(station_specific_only=True)
-        
-        return {
-            'success': True,
-            'count': len(articles),
-            'articles': articles
-        }
+        return await get_partition_response(
+            'local',
+            article_filter=lambda article: radio_scraper.is_station_specific_content(article.content_type)
+        )
     except Exception as e:
         logger.error(f"Error fetching radio station news: {e}")
         return {
@@ -229,14 +679,14 @@ async def get_radio_station_news():
 
 
 @app.post("/api/news/refresh")
-async def refresh_news(background_tasks: BackgroundTasks):
+async def refresh_news():
     if cache_manager.is_updating:
         return {
             'success': False,
             'message': 'Update already in progress'
         }
     
-    background_tasks.add_task(update_news_cache)
+    cache_manager.start_refresh(update_news_cache)
     
     return {
         'success': True,
@@ -246,4 +696,45 @@ async def refresh_news(background_tasks: BackgroundTasks):
 
 @app.get("/api/cache/status")
 async def cache_status():
-    return cache_manager.get_cache_info()
+    cache_info = cache_manager.get_cache_info()
+    cache_info['conditional_get'] = rss_aggregator.conditional_cache.get_stats()
+    cache_info['fingerprints'] = fingerprint_store.get_stats()
+    cache_info['event_stream'] = event_broadcaster.get_stats()
+    cache_info['shared_state'] = shared_state.get_stats()
+    cache_info['refresh_schedule'] = refresh_scheduler.get_stats()
+    cache_info['circuit_breakers'] = source_breakers.get_stats()
+    return cache_info
+
+
+@app.get("/api/cache/trace")
+async def cache_trace(
+    limit: int = Query(5, ge=1, le=50),
+    trace_format: str = Query('json', alias='format', pattern='^(json|chrome)$')
+):
+    """
+    Span timings of the most recent refresh cycles, newest first. format=chrome returns
+    Chrome trace-event JSON for chrome://tracing or ui.perfetto.dev.
+    """
+    traces = tracer.recent(limit)
+    if trace_format == 'chrome':
+        return Response(
+            content=dumps(tracer.to_chrome(traces)),
+            media_type='application/json',
+            headers={'Content-Disposition': 'attachment; filename="news-trace.json"'}
+        )
+    return Response(
+        content=dumps({'count': len(traces), 'traces': [trace.to_dict() for trace in traces]}),
+        media_type='application/json'
+    )
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus text exposition of the pipeline metrics"""
+    age = cache_manager.get_snapshot_age()
+    pipeline_metrics.snapshot_age.replace({(): age.total_seconds()} if age is not None else {})
+    pipeline_metrics.snapshot_version.set(cache_manager.version)
+    pipeline_metrics.circuit_open.replace({
+        (source_id,): int(state['state'] == 'open') for source_id, state in source_breakers.get_stats().items()
+    })
+    return Response(content=pipeline_metrics.render(), media_type='text/plain; version=0.0.4; charset=utf-8')
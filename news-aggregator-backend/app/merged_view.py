@@ -0,0 +1,168 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+
+from app.aggregator_service import AggregatorService
+from app.article import Article
+from app.near_duplicates import NearDuplicateIndex
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class MergedView:
+    """
+    Newest-first, deduplicated view over every source, maintained incrementally.
+
+    Each source keeps its last-known article set. apply() diffs a source's new set against
+    it and only inserts/removes the articles that changed, so a refresh costs O(changes)
+    index updates instead of re-sorting and re-deduplicating the whole corpus.
+
+    Deduplication follows AggregatorService.remove_duplicates: of two articles with the
+    same URL or similar titles, the newer one is visible and the older one is shadowed.
+    A shadowed article becomes visible again if its winner is removed.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.8):
+        self.similarity_threshold = similarity_threshold
+        self.source_articles: Dict[str, Dict[str, Article]] = {}
+        self.entries: Dict[str, Article] = {}
+        self.entry_source: Dict[str, str] = {}
+        # Visible articles only, ascending by sort key; read in reverse for newest-first
+        self.order: List[Tuple[int, str]] = []
+        self.visible_titles = NearDuplicateIndex(similarity_threshold)
+        self.visible_urls: Dict[str, str] = {}
+        self.shadowed_by: Dict[str, str] = {}
+        self.shadows: Dict[str, Set[str]] = {}
+
+    @staticmethod
+    def article_key(source_id: str, article: Article) -> str:
+        return f"{source_id}\x00{article.get('url') or article.get('title', '')}"
+
+    def sort_key(self, key: str) -> Tuple[int, str]:
+        return (self.entries[key].get('published_ts') or 0, key)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def apply(self, source_id: str, articles: List[Article]) -> Tuple[List[Article], List[Article]]:
+        """
+        Replace source_id's article set with `articles`, touching only what changed.
+        Returns (added, removed): articles that became visible / stopped being visible.
+        """
+        old = self.source_articles.get(source_id, {})
+        new = {}
+        for article in articles:
+            new.setdefault(self.article_key(source_id, article), article)
+
+        removed_keys = [key for key, article in old.items() if new.get(key) != article]
+        added_keys = [key for key, article in new.items() if old.get(key) != article]
+
+        changes = {'added': {}, 'removed': {}}
+        for key in removed_keys:
+            self._remove(key, changes)
+        for key in sorted(added_keys, key=lambda k: (new[k].get('published_ts') or 0, k), reverse=True):
+            self.entries[key] = new[key]
+            self.entry_source[key] = source_id
+            self._insert(key, changes)
+
+        self.source_articles[source_id] = new
+
+        logger.info(
+            f"Merged view delta for {source_id}: +{len(added_keys)} -{len(removed_keys)} "
+            f"({len(self.order)} visible articles)"
+        )
+        return list(changes['added'].values()), list(changes['removed'].values())
+
+    def drop_source(self, source_id: str) -> Tuple[List[Article], List[Article]]:
+        return self.apply(source_id, [])
+
+    def articles(self, limit: Optional[int] = None) -> List[Article]:
+        """Visible articles, newest first"""
+        order = self.order if limit is None else self.order[max(len(self.order) - limit, 0):]
+        return [self.entries[key] for _, key in reversed(order)]
+
+    def ordered_items(self) -> List[Tuple[str, Article]]:
+        """(source_id, article) pairs for visible articles, newest first"""
+        return [(self.entry_source[key], self.entries[key]) for _, key in reversed(self.order)]
+
+    def _conflicts(self, key: str) -> Set[str]:
+        article = self.entries[key]
+        conflicts = set()
+
+        url = article.get('url', '')
+        if url and url in self.visible_urls:
+            conflicts.add(self.visible_urls[url])
+
+        normalized_title = AggregatorService.normalize_title(article.get('title', ''))
+        conflicts.update(self.visible_titles.similar(normalized_title))
+
+        return conflicts
+
+    def _show(self, key: str, changes: Dict):
+        article = self.entries[key]
+        insort(self.order, self.sort_key(key))
+        self.visible_titles.add(key, AggregatorService.normalize_title(article.get('title', '')))
+        if article.get('url'):
+            self.visible_urls[article['url']] = key
+        # An article hidden and re-shown within one delta is not a change
+        if changes['removed'].get(key) is article:
+            del changes['removed'][key]
+        else:
+            changes['added'][key] = article
+
+    def _hide(self, key: str, changes: Dict):
+        article = self.entries[key]
+        index = bisect_left(self.order, self.sort_key(key))
+        del self.order[index]
+        self.visible_titles.remove(key)
+        if article.get('url') and self.visible_urls.get(article['url']) == key:
+            del self.visible_urls[article['url']]
+        if changes['added'].get(key) is article:
+            del changes['added'][key]
+        else:
+            changes['removed'][key] = article
+
+    def _shadow(self, key: str, winner: str):
+        self.shadowed_by[key] = winner
+        self.shadows.setdefault(winner, set()).add(key)
+
+    def _insert(self, key: str, changes: Dict):
+        conflicts = self._conflicts(key)
+        sort_key = self.sort_key(key)
+
+        newer = [other for other in conflicts if self.sort_key(other) > sort_key]
+        if newer:
+            self._shadow(key, max(newer, key=self.sort_key))
+            return
+
+        # The new article wins: older conflicting articles move under it, and whatever they
+        # were hiding is re-checked, since it need not conflict with the new article
+        self._show(key, changes)
+        released = set()
+        for other in conflicts:
+            self._hide(other, changes)
+            self._shadow(other, key)
+            released.update(self.shadows.pop(other, set()))
+        self._reinsert(released, changes)
+
+    def _reinsert(self, released: Set[str], changes: Dict):
+        """Give articles whose winner stopped being visible a fresh chance, newest first"""
+        released = sorted(released, key=self.sort_key, reverse=True)
+        for shadowed in released:
+            del self.shadowed_by[shadowed]
+        for shadowed in released:
+            self._insert(shadowed, changes)
+
+    def _remove(self, key: str, changes: Dict):
+        winner = self.shadowed_by.pop(key, None)
+        if winner is not None:
+            self.shadows[winner].discard(key)
+            if not self.shadows[winner]:
+                del self.shadows[winner]
+        else:
+            self._hide(key, changes)
+            self._reinsert(self.shadows.pop(key, set()), changes)
+
+        del self.entries[key]
+        del self.entry_source[key]
@@ -0,0 +1,184 @@
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+import threading
+
+LabelValues = Tuple[str, ...]
+
+
+def escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric:
+    kind = ''
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+
+    def label_values(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = self.label_values(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self.lock:
+            items = sorted(self.values.items())
+        return self.header() + [
+            f"{self.name}{format_labels(self.labelnames, key)} {format_value(value)}" for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def set(self, value: float, **labels: str):
+        key = self.label_values(labels)
+        with self.lock:
+            self.values[key] = value
+
+    def replace(self, values: Dict[LabelValues, float]):
+        """Swap in a full set of label values at once (drops labels no longer present)"""
+        with self.lock:
+            self.values = dict(values)
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = ()):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (+Inf last), sum, count
+        self.series: Dict[LabelValues, List] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self.label_values(labels)
+        with self.lock:
+            series = self.series.get(key)
+            if series is None:
+                series = self.series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        with self.lock:
+            items = sorted((key, [list(series[0]), series[1], series[2]]) for key, series in self.series.items())
+
+        lines = self.header()
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = f'le="{format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{format_labels(self.labelnames, key)} {format_value(total)}")
+            lines.append(f"{self.name}_count{format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class PipelineMetrics:
+    """
+    Prometheus metrics for the aggregation pipeline, rendered in the text exposition format
+    at /metrics. Values are per process; in multi-worker mode fetch metrics come from the updater.
+    """
+
+    def __init__(self):
+        self.fetch_seconds = Histogram(
+            'news_source_fetch_seconds', 'HTTP latency of one feed or station page request (until the body is read)',
+            ('source',), (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30)
+        )
+        self.refresh_seconds = Histogram(
+            'news_source_refresh_seconds', 'Wall time of one source refresh (fetch, parse, filter)',
+            ('source', 'kind'), (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 15, 20, 25, 30)
+        )
+        self.fetches = Counter(
+            'news_source_fetches_total', 'Source refreshes by outcome (ok, failed, deadline, queued, circuit_open)',
+            ('source', 'outcome')
+        )
+        self.http_responses = Counter(
+            'news_http_responses_total', 'HTTP responses from feeds and station pages by status code',
+            ('source', 'status')
+        )
+        self.bytes_downloaded = Counter(
+            'news_http_bytes_downloaded_total', 'Response bytes received on the wire (before decompression)',
+            ('source',)
+        )
+        self.parse_seconds = Histogram(
+            'news_parse_seconds', 'Time spent parsing one feed or page in the parse pool (excluding queueing)',
+            ('source',), (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+        )
+        self.articles_kept = Counter(
+            'news_articles_kept_total', 'Articles returned by source refreshes',
+            ('source',)
+        )
+        self.articles_dropped = Counter(
+            'news_articles_dropped_total', 'Articles dropped while fetching, by reason (recency, political, short_title)',
+            ('source', 'reason')
+        )
+        self.snapshot_articles = Gauge(
+            'news_snapshot_articles', 'Articles in the current version by stage (sources, deduplicated, published)',
+            ('stage',)
+        )
+        self.snapshot_dropped = Gauge(
+            'news_snapshot_articles_dropped', 'Articles removed from the current version by reason (dedup, diversity)',
+            ('reason',)
+        )
+        self.cycle_seconds = Histogram(
+            'news_refresh_cycle_seconds', 'Wall time of a refresh cycle (full, national, local, scheduled)',
+            ('cycle',), (1, 2.5, 5, 10, 15, 20, 25, 30, 60, 120)
+        )
+        self.snapshot_age = Gauge('news_snapshot_age_seconds', 'Age of the cached snapshot')
+        self.snapshot_version = Gauge('news_snapshot_version', 'Version number of the cached snapshot')
+        self.circuit_open = Gauge(
+            'news_source_circuit_open', '1 while a source is skipped by its circuit breaker',
+            ('source',)
+        )
+
+    def record_drops(self, source: str, dropped: Dict[str, int]):
+        for reason, count in dropped.items():
+            if count:
+                self.articles_dropped.inc(count, source=source, reason=reason)
+
+    def render(self) -> str:
+        lines = []
+        for metric in (
+            self.fetch_seconds, self.refresh_seconds, self.fetches, self.http_responses, self.bytes_downloaded, self.parse_seconds,
+            self.articles_kept, self.articles_dropped, self.snapshot_articles, self.snapshot_dropped,
+            self.cycle_seconds, self.snapshot_age, self.snapshot_version, self.circuit_open
+        ):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+pipeline_metrics = PipelineMetrics()
@@ -0,0 +1,95 @@
+from math import ceil
+from typing import Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
+
+# Guards the ceil()/length bounds against float rounding; only ever widens the search
+EPSILON = 1e-9
+
+# Ordered last in prefixes: almost every headline has some, so indexing them would make
+# their candidate lists grow with the corpus
+COMMON_WORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in', 'is',
+    'it', 'its', 'new', 'of', 'on', 'or', 'over', 'says', 'that', 'the', 'this', 'to', 'up',
+    'was', 'will', 'with',
+))
+
+
+class NearDuplicateIndex:
+    """
+    Exact word-set Jaccard lookup (same semantics as AggregatorService.titles_are_similar)
+    without comparing against every indexed title.
+
+    Prefix filtering: with tokens in a fixed global order, two sets with Jaccard >= t must
+    share a token within the first |x| - ceil(t * |x|) + 1 tokens of each. Only those
+    prefix tokens are indexed, so a lookup verifies a handful of candidates, and those are
+    length-filtered before the exact Jaccard check.
+    """
+
+    def __init__(self, threshold: float = 0.8):
+        self.threshold = threshold
+        self.tokens: Dict[Hashable, FrozenSet[str]] = {}
+        self.prefixes: Dict[Hashable, Tuple[str, ...]] = {}
+        self.prefix_index: Dict[str, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.tokens
+
+    def prefix(self, tokens: FrozenSet[str]) -> Tuple[str, ...]:
+        # Any fixed total order is correct; common words go last, the rest in hash order
+        required_overlap = ceil(self.threshold * len(tokens) - EPSILON)
+        ordered = sorted(tokens, key=lambda token: (token in COMMON_WORDS, hash(token), token))
+        return tuple(ordered[:len(tokens) - required_overlap + 1])
+
+    def add(self, key: Hashable, normalized_title: str):
+        """Index a normalized title under key (replacing whatever key held before)"""
+        if key in self.tokens:
+            self.remove(key)
+
+        tokens = frozenset(normalized_title.split())
+        prefix = self.prefix(tokens) if tokens else ()
+        self.tokens[key] = tokens
+        self.prefixes[key] = prefix
+        for token in prefix:
+            self.prefix_index.setdefault(token, set()).add(key)
+
+    def remove(self, key: Hashable):
+        self.tokens.pop(key, None)
+        for token in self.prefixes.pop(key, ()):
+            keys = self.prefix_index[token]
+            keys.discard(key)
+            if not keys:
+                del self.prefix_index[token]
+
+    def similar(self, normalized_title: str, first_only: bool = False) -> List[Hashable]:
+        """Keys whose title has word-set Jaccard >= threshold with normalized_title"""
+        tokens = frozenset(normalized_title.split())
+        if not tokens:
+            return []
+
+        min_size = self.threshold * len(tokens) - EPSILON
+        max_size = len(tokens) / self.threshold + EPSILON
+        checked = set()
+        matches = []
+
+        for token in self.prefix(tokens):
+            for key in self.prefix_index.get(token, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+
+                other = self.tokens[key]
+                if not min_size <= len(other) <= max_size:
+                    continue
+                if len(tokens & other) / len(tokens | other) >= self.threshold:
+                    matches.append(key)
+                    if first_only:
+                        return matches
+
+        return matches
+
+    def find(self, normalized_title: str) -> Optional[Hashable]:
+        """Any one key similar to normalized_title, or None"""
+        matches = self.similar(normalized_title, first_only=True)
+        return matches[0] if matches else None
@@ -0,0 +1,95 @@
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+import base64
+import json
+
+from app.article import Article
+
+# (published_ts, merged-view key) of an article: a total order, stable across cache versions
+Position = Tuple[int, str]
+
+
+def encode_cursor(position: Position) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(position)).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Position:
+    """Inverse of encode_cursor; ValueError for anything it did not produce"""
+    try:
+        published_ts, key = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    if not isinstance(published_ts, int) or not isinstance(key, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return published_ts, key
+
+
+class NewsIndex:
+    """
+    The full deduplicated article set of one cache version, newest first, with presorted
+    position arrays per source, per content type and per (source, content type).
+
+    Every filter maps to one array of ascending positions, so a page is two bisects and a
+    slice. Cursors carry the last article's (published_ts, key) rather than a position,
+    so they keep working after the index is rebuilt for a newer version.
+    """
+
+    def __init__(self, entries: List[Tuple[str, Article]]):
+        self.articles: List[Article] = [article for _, article in entries]
+        self.keys: List[str] = [key for key, _ in entries]
+        # Oldest first, for bisecting cursor and `since` bounds into newest-first positions
+        self.ascending: List[Position] = [(article.published_ts, key) for key, article in reversed(entries)]
+
+        self.by_source: Dict[str, array] = {}
+        self.by_type: Dict[str, array] = {}
+        self.by_source_type: Dict[Tuple[str, str], array] = {}
+        for position, article in enumerate(self.articles):
+            self.by_source.setdefault(article.source, array('I')).append(position)
+            self.by_type.setdefault(article.content_type, array('I')).append(position)
+            self.by_source_type.setdefault((article.source, article.content_type), array('I')).append(position)
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def positions(self, source: Optional[str] = None, content_type: Optional[str] = None) -> Sequence[int]:
+        if source is not None and content_type is not None:
+            return self.by_source_type.get((source, content_type), ())
+        if source is not None:
+            return self.by_source.get(source, ())
+        if content_type is not None:
+            return self.by_type.get(content_type, ())
+        return range(len(self.articles))
+
+    def page(
+        self,
+        source: Optional[str] = None,
+        content_type: Optional[str] = None,
+        since_ts: Optional[int] = None,
+        after: Optional[Position] = None,
+        limit: int = 50
+    ) -> Tuple[List[Article], Optional[Position], int]:
+        """
+        Up to `limit` matching articles older than `after`, newest first.
+        Returns (articles, position of the last one if more follow, matches in total).
+        """
+        positions = self.positions(source, content_type)
+        count = len(self.articles)
+
+        end = len(positions)
+        if since_ts is not None:
+            # Articles with published_ts >= since_ts occupy the first global positions
+            end = bisect_left(positions, count - bisect_left(self.ascending, (since_ts,)))
+
+        start = 0
+        if after is not None:
+            start = bisect_left(positions, count - bisect_left(self.ascending, after))
+
+        stop = min(start + limit, end)
+        page = [self.articles[position] for position in positions[start:stop]]
+
+        next_after = None
+        if stop < end:
+            last = positions[stop - 1]
+            next_after = (self.articles[last].published_ts, self.keys[last])
+        return page, next_after, end
@@ -0,0 +1,50 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+import multiprocessing
+import os
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ParsePool:
+    """
+    Bounded process pool for CPU-bound parsing (feedparser, BeautifulSoup).
+    Jobs must be module-level functions that take raw bytes/strings and return plain dicts,
+    so arguments and results pickle cheaply. Until start() is called, jobs run inline.
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self.max_workers = max_workers
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        if self.executor is not None:
+            return
+
+        # spawn avoids forking a process that already runs an event loop and helper threads
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        logger.info(f"Parse pool started with {self.max_workers} worker process(es)")
+
+    def shutdown(self):
+        if self.executor is None:
+            return
+
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.executor = None
+        logger.info("Parse pool shut down")
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.executor is None:
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+
+parse_pool = ParsePool(int(os.environ.get('PARSE_POOL_WORKERS', '1')))
@@ -1,93 +1,132 @@
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import datetime
 from dateutil import parser as date_parser
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin
+import asyncio
 import re
 import logging
-import time
 import random
 import hashlib
+import time
+
+from app.article import Article
+from app.extractors import ProfileExtractor, get_extractor, parse_document
+from app.fingerprint_store import fingerprint_store
+from app.host_scheduler import HostScheduler
+from app.http_client import http_client
+from app.metrics import pipeline_metrics
+from app.parse_pool import parse_pool
+from app.selection import DiversitySelector
+from app.timestamps import set_published, to_utc
+from app.tracer import tracer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Standard WordPress theme markup (post_class(), entry-title, entry-date with an ISO 8601
+# datetime attribute). Only give a station this profile once its pages are confirmed to use
+# that markup; stations without a profile use the generic engine.
+WORDPRESS_PROFILE = {
+    'item': "//article[contains(concat(' ', normalize-space(@class), ' '), ' type-post ')]",
+    'title': "(.//*[contains(concat(' ', normalize-space(@class), ' '), ' entry-title ')])[1]",
+    'link': "(.//*[contains(concat(' ', normalize-space(@class), ' '), ' entry-title ')]//a/@href)[1]",
+    'description': "(.//*[contains(concat(' ', normalize-space(@class), ' '), ' entry-summary ')])[1]",
+    'image': "(.//img/@src)[1]",
+    'date': "(.//time/@datetime)[1]",
+    'date_format': '%Y-%m-%dT%H:%M:%S%z',
+}
+
 
 class BoiseRadioScraper:
     def __init__(self):
         # Top 15 Boise radio stations - ALL GET EQUAL TREATMENT
+        # ('weight' is the station's Nielsen share, only used when weighted quotas are enabled)
         self.stations = {
             'thebull': {
                 'name': '101.9 The Bull',
                 'homepage': 'https://boisebull.com',
                 'subpages': ['/contests/', '/shows-schedule/', '/events/'],
                 'logo': 'https://boisebull.com/wp-content/uploads/2021/01/bull-logo.png',
+                'weight': 6.6,  # Nielsen share
             },
             'my1027': {
                 'name': 'My 102.7',
                 'homepage': 'https://my1027.com',
                 'subpages': ['/contests/', '/events/', '/category/entertainment/'],
                 'logo': 'https://my1027.com/wp-content/uploads/2021/01/my1027-logo.png',
+                'weight': 5.8,
             },
             'bobfm': {
                 'name': '96.1 Bob FM',
                 'homepage': 'https://961bobfm.com',
                 'subpages': ['/contests/', '/events/'],
                 'logo': 'https://961bobfm.com/wp-content/uploads/2021/01/bobfm-logo.png',
+                'weight': 5.5,
             },
             'eagle969': {
                 'name': '96.9 The Eagle',
                 'homepage': 'https://www.kkgl.com',
                 'subpages': ['/shows/', '/events/'],
                 'logo': 'https://www.kkgl.com/wp-content/uploads/2021/01/eagle-logo.png',
+                'weight': 4.3,
             },
             'xrock': {
                 'name': '100.3 The X',
                 'homepage': 'https://www.xrock.com',
                 'subpages': ['/category/contests/', '/events/', '/podcast/'],
                 'logo': 'https://www.xrock.com/wp-content/uploads/2021/01/xrock-logo.png',
+                'weight': 3.7,
             },
             'wowcountry': {
                 'name': 'Wow Country 104.3',
                 'homepage': 'https://wowcountry1043.com',
                 'subpages': ['/contests/', '/events/'],
                 'logo': 'https://wowcountry1043.com/wp-content/uploads/2021/01/wow-logo.png',
+                'weight': 3.3,
             },
             'kboi': {
                 'name': 'KBOI 93.1FM & 670AM',
                 'homepage': 'https://kboi.com',
                 'subpages': ['/blog/', '/events/'],
                 'logo': 'https://kboi.com/wp-content/uploads/2021/01/kboi-logo.png',
+                'weight': 3.3,
             },
             'kido': {
                 'name': 'KIDO Talk Radio',
                 'homepage': 'https://kidotalkradio.com',
                 'subpages': ['/blog/'],  # Only 1 page
                 'logo': 'https://kidotalkradio.com/wp-content/uploads/2021/01/kido-logo.png',
+                'weight': 2.9,
             },
             'wild101': {
                 'name': 'Wild 101',
                 'homepage': 'https://wild101.com',
                 'subpages': ['/contests/', '/events/'],
                 'logo': 'https://wild101.com/wp-content/uploads/2021/01/wild-logo.png',
+                'weight': 2.9,
             },
             'kissfm': {
                 'name': '103.5 Kiss FM',
                 'homepage': 'https://1035kissfmboise.com',
                 'subpages': ['/contests/', '/events/'],
                 'logo': 'https://1035kissfmboise.com/wp-content/uploads/2021/01/kissfm-logo.png',
+                'weight': 2.5,
             },
             'river': {
                 'name': '94.9 The River',
                 'homepage': 'https://riverboise.com',
                 'subpages': ['/category/contests/', '/events/', '/podcast/'],
                 'logo': 'https://riverboise.com/wp-content/uploads/2021/01/river-logo.png',
+                'weight': 2.3,
             },
             'q927': {
                 'name': 'Q92.7 KQFC',
                 'homepage': 'https://www.q927.com',
                 'subpages': ['/shows/', '/events/'],
                 'logo': 'https://www.q927.com/wp-content/uploads/2021/01/q927-logo.png',
+                'weight': 1.2,
             },
             
                'hankfm': {
@@ -95,18 +134,21 @@ class BoiseRadioScraper:
                    'homepage': 'https://www.crankthehankboise.com',
                    'subpages': ['/contests/', '/events/', '/category/news/'],
                    'logo': 'https://www.crankthehankboise.com/wp-content/uploads/2021/01/hank-logo.png',
+                   'weight': 1.2,
                },
             'ktik': {
                 'name': '93.1 KTIK',
                 'homepage': 'https://931ktik.com',
                 'subpages': ['/shows/', '/blog/'],
                 'logo': 'https://931ktik.com/wp-content/uploads/2021/01/ktik-logo.png',
+                'weight': 1.2,
             },
             'kfxd': {
                 'name': '630 KFXD',
                 'homepage': 'https://kfxd.com',
                 'subpages': ['/shows/', '/blog/'],
                 'logo': 'https://kfxd.com/wp-content/uploads/2021/01/kfxd-logo.png',
+                'weight': 0.4,
             },
         }
         
@@ -131,8 +173,43 @@ class BoiseRadioScraper:
         # Contest keywords to identify legitimate contests
         self.contest_keywords = ['win', 'giveaway', 'contest', 'enter to', 'prize', 'tickets']
         
-        # Track seen articles by hash to avoid duplicates
-        self.seen_hashes = set()
+        # Last successful result per page URL, reused for pages not picked (or failing) this cycle
+        self.page_articles: Dict[str, List[Article]] = {}
+        
+        self.http_client = http_client
+        self.parse_pool = parse_pool
+        
+        # Cross-cycle first-seen times; undated articles keep the time they first appeared
+        self.fingerprint_store = fingerprint_store
+        
+        self.metrics = pipeline_metrics
+        self.tracer = tracer
+        
+        # Only requests to the same host are spaced out; different stations run in parallel
+        self.host_scheduler = HostScheduler(min_delay=0.5, max_delay=1.5)
+        
+        # A station's pages run one after another, so the station as a whole is cut off at
+        # station_timeout (inside main's cycle deadline), keeping the pages that finished
+        self.page_timeout = 6
+        self.station_timeout = 20
+        
+        # Extraction engine for stations without an explicit 'engine' key ('lxml' or 'soup')
+        self.default_engine = 'lxml'
+        
+        # Selection: max 2 per station in any 10 articles; Nielsen-weighted quotas are opt-in
+        self.use_weighted_quotas = False
+        self.weighted_quota_total = 100
+        self.station_weights = {
+            station_config['name']: station_config['weight']
+            for station_config in self.stations.values()
+        }
+        
+        # Per-station extraction profiles, compiled once; the generic engine is only the fallback
+        self.extraction_profiles = {
+            station_id: ProfileExtractor(station_config['profile'])
+            for station_id, station_config in self.stations.items()
+            if station_config.get('profile')
+        }
 
     def get_article_hash(self, article: Dict) -> str:
         """Generate a hash for an article to detect duplicates"""
@@ -147,104 +224,169 @@ class BoiseRadioScraper:
         # Filter out if political AND not a contest
         return has_political and not has_contest
 
-    def get_fallback_image(self, station_logo: str) -> str:
-        """Get a random fallback image (70% varied, 30% station logo)"""
-        if random.random() < 0.3:
+    def get_fallback_image(self, station_logo: str, seed: Optional[str] = None) -> str:
+        """
+        Get a fallback image (70% varied, 30% station logo). With a seed the choice is stable,
+        so re-scraping the same article does not look like a change.
+        """
+        rng = random.Random(seed) if seed is not None else random
+        if rng.random() < 0.3:
             return station_logo
-        return random.choice(self.fallback_images)
+        return rng.choice(self.fallback_images)
 
-    def scrape_with_requests(self, url: str, station_name: str, timeout: int = 10) -> List[Dict]:
-        """Scrape using requests library only - fast and lightweight"""
+    async def scrape_page(self, url: str, station_id: str, timeout: int = 10) -> Optional[List[Dict]]:
+        """Fetch a station page through the shared HTTP client and extract its articles; None on failure"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=timeout)
+            with self.tracer.span('http', url=url) as span:
+                started = time.perf_counter()
+                response = await self.http_client.get(url, timeout=timeout)
+                self.metrics.fetch_seconds.observe(time.perf_counter() - started, source=station_id)
+                span.update(status=response.status_code, bytes=response.num_bytes_downloaded)
+            self.metrics.http_responses.inc(source=station_id, status=response.status_code)
+            self.metrics.bytes_downloaded.inc(response.num_bytes_downloaded, source=station_id)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = []
-            
-            # Find article elements
-            article_elements = soup.find_all(['article', 'div'], class_=re.compile(r'post|article|entry|item|card'))
-            
-            for element in article_elements[:10]:  # Limit to 10 per page
-                try:
-                    # Extract title
-                    title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'a'], class_=re.compile(r'title|headline|entry-title'))
-                    if not title_elem:
-                        continue
-                    
-                    title = self.clean_text(title_elem.get_text())
-                    if len(title) < 10:
-                        continue
-                    
-                    # Filter political content
-                    if self.is_political_content(title):
-                        logger.info(f"Filtered political content: {title}")
-                        continue
-                    
-                    # Extract link
-                    link_elem = element.find('a', href=True)
-                    link = link_elem['href'] if link_elem else url
-                    if not link.startswith('http'):
-                        from urllib.parse import urljoin
-                        link = urljoin(url, link)
-                    
-                    # Extract description
-                    desc_elem = element.find(['p', 'div'], class_=re.compile(r'excerpt|summary|description'))
-                    description = self.clean_text(desc_elem.get_text()) if desc_elem else title
-                    
-                    # Extract image
-                    img_elem = element.find('img', src=True)
-                    image = img_elem['src'] if img_elem else None
-                    if image and not image.startswith('http'):
-                        from urllib.parse import urljoin
-                        image = urljoin(url, image)
-                    
-                    # Extract date
-                    date_elem = element.find(['time', 'span'], class_=re.compile(r'date|time|published'))
-                    published = datetime.now()
-                    if date_elem:
-                        try:
-                            date_str = date_elem.get('datetime') or date_elem.get_text()
-                            published = date_parser.parse(date_str)
-                        except:
-                            pass
-                    
-                    # Only include recent content (last 7 days)
-                    if (datetime.now() - published).days > 7:
-                        continue
-                    
-                    # Determine content type
-                    content_type = self.classify_content_type(title + ' ' + description)
-                    
-                    article = {
-                        'title': title,
-                        'url': link,  # Changed from 'link' to 'url' to match frontend expectations
-                        'description': description[:200],
-                        'image': image,
-                        'source': station_name,
-                        'published': published.isoformat(),
-                        'content_type': content_type
-                    }
-                    
-                    # Check for duplicates
-                    article_hash = self.get_article_hash(article)
-                    if article_hash not in self.seen_hashes:
-                        self.seen_hashes.add(article_hash)
-                        articles.append(article)
-                
-                except Exception as e:
-                    logger.debug(f"Error parsing article element: {e}")
-                    continue
+            # HTML parsing is CPU-bound, so it runs in the parse pool
+            with self.tracer.span('parse') as span:
+                articles, stats = await self.parse_pool.run(parse_station_page, response.content, url, station_id)
+                self.tracer.add_stages(stats['stages'], stats['seconds'])
+                span.update(articles=len(articles))
+            self.metrics.parse_seconds.observe(stats['seconds'], source=station_id)
+            self.metrics.record_drops(station_id, stats['dropped'])
             
             logger.info(f"Found {len(articles)} articles from {url}")
             return articles
             
         except Exception as e:
             logger.error(f"Error scraping {url}: {e}")
-            return []
+            return None
+
+    def parse_page(
+        self,
+        content: bytes,
+        url: str,
+        station_name: str,
+        engine: str = 'soup',
+        station_id: Optional[str] = None,
+        dropped: Optional[Counter] = None
+    ) -> List[Dict]:
+        """
+        Extract article dicts from a station page. The station's compiled profile runs first;
+        the generic engine only runs when there is no profile or it found no titled item.
+        Skipped candidates are counted by reason in `dropped`.
+        """
+        if dropped is None:
+            dropped = Counter()
+        articles = []
+        candidates = []
+        date_format = None
+        tree = None
+        
+        profile = self.extraction_profiles.get(station_id)
+        if profile:
+            with tracer.stage('extract_profile'):
+                tree = parse_document(content)
+                candidates = profile.extract(content, max_items=10, tree=tree)
+            date_format = profile.date_format
+        
+        if not any(candidate['title'] for candidate in candidates):
+            with tracer.stage(f'extract_{engine}'):
+                candidates = get_extractor(engine).extract(content, max_items=10, tree=tree)  # Limit to 10 per page
+            date_format = None
+        
+        for candidate in candidates:
+            try:
+                article = self.build_article(candidate, url, station_name, date_format, dropped)
+                if article:
+                    articles.append(article)
+            except Exception as e:
+                logger.debug(f"Error parsing article element: {e}")
+                continue
+        
+        return articles
+
+    def build_article(
+        self,
+        candidate: Dict,
+        url: str,
+        station_name: str,
+        date_format: Optional[str] = None,
+        dropped: Optional[Counter] = None
+    ) -> Optional[Dict]:
+        """Turn raw extracted fields into an article dict, or None if it should be skipped"""
+        if dropped is None:
+            dropped = Counter()
+        if candidate['title'] is None:
+            return None
+        
+        title = self.clean_text(candidate['title'])
+        if len(title) < 10:
+            dropped['short_title'] += 1
+            return None
+        
+        # Filter political content
+        if self.is_political_content(title):
+            logger.info(f"Filtered political content: {title}")
+            dropped['political'] += 1
+            return None
+        
+        link = candidate['link'] or url
+        if not link.startswith('http'):
+            link = urljoin(url, link)
+        
+        description = self.clean_text(candidate['description']) if candidate['description'] is not None else title
+        
+        image = candidate['image']
+        if image and not image.startswith('http'):
+            image = urljoin(url, image)
+        
+        # Undated: the parent stamps the first-seen time from the fingerprint store
+        published = None
+        if candidate['date'] is not None:
+            try:
+                published = to_utc(self.parse_date(candidate['date'], date_format))
+            except:
+                pass
+        
+        # Only include recent content (last 7 days)
+        if published is not None and not self.is_recent(int(published.timestamp())):
+            dropped['recency'] += 1
+            return None
+        
+        # Determine content type
+        content_type = self.classify_content_type(title + ' ' + description)
+        
+        article = {
+            'title': title,
+            'url': link,  # Changed from 'link' to 'url' to match frontend expectations
+            'description': description[:200],
+            'image': image,
+            'source': station_name,
+            'published': None,
+            'published_ts': None,
+            'content_type': content_type
+        }
+        if published is not None:
+            set_published(article, published)
+        return article
+
+    def cutoff_ts(self) -> int:
+        """Oldest published_ts is_recent accepts"""
+        return int(time.time()) - 8 * 86400 + 1
+
+    def is_recent(self, published_ts: int) -> bool:
+        """Published within the last 7 days (whole days, as timedelta.days counts them)"""
+        return published_ts >= self.cutoff_ts()
+
+    def parse_date(self, date_str: str, date_format: Optional[str] = None) -> datetime:
+        """Parse with the profile's strptime format when there is one, falling back to dateutil"""
+        if date_format:
+            try:
+                return datetime.strptime(date_str.strip(), date_format)
+            except ValueError:
+                pass
+        with tracer.stage('dateutil'):
+            return date_parser.parse(date_str)
 
     def classify_content_type(self, text: str) -> str:
         """Classify the type of content"""
@@ -279,81 +421,178 @@ class BoiseRadioScraper:
         text = text.replace('\u2013', '-').replace('\u2014', '-')
         return text.strip()
 
-    def apply_diversity_filter(self, articles: List[Dict], window_size: int = 10, max_per_station: int = 2) -> List[Dict]:
+    def apply_diversity_filter(
+        self,
+        articles: List[Dict],
+        window_size: int = 10,
+        max_per_station: int = 2,
+        weighted: Optional[bool] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
         """
         Ensure no station appears more than max_per_station times in any window_size consecutive articles.
-        This creates a balanced, varied feed throughout.
+        This creates a balanced, varied feed throughout. With weighted quotas each station also gets at
+        most its Nielsen-weighted share of `limit` (default weighted_quota_total) articles.
         """
         if len(articles) <= window_size:
             return articles
         
-        filtered = []
+        if weighted is None:
+            weighted = self.use_weighted_quotas
+        if weighted and limit is None:
+            limit = self.weighted_quota_total
         
-        for article in articles:
-            # Check the last window_size articles
-            window_start = max(0, len(filtered) - window_size)
-            recent_articles = filtered[window_start:]
-            
-            # Count how many times this station appears in the window
-            station = article['source']
-            count_in_window = sum(1 for a in recent_articles if a['source'] == station)
-            
-            # Only add if under the limit
-            if count_in_window < max_per_station:
-                filtered.append(article)
+        selector = DiversitySelector(
+            window_size=window_size,
+            max_per_window=max_per_station,
+            weights=self.station_weights if weighted else None,
+            limit=limit
+        )
+        filtered = list(selector.select(articles))
         
         logger.info(f"Diversity filter: {len(articles)} -> {len(filtered)} articles")
         return filtered
 
-    async def scrape_all_stations(self, station_specific_only: bool = False) -> List[Dict]:
+    async def scrape_url(self, url: str, station_id: str) -> Optional[List[Article]]:
+        """Scrape one page, waiting for its host's politeness slot first; None on failure"""
+        station_config = self.stations[station_id]
+        try:
+            async with self.host_scheduler.slot(url):
+                with self.tracer.span('page', url=url):
+                    articles = await self.scrape_page(url, station_id, timeout=self.page_timeout)
+            if articles is None:
+                return None
+            
+            # Undated articles get their first-seen time and age out like dated ones
+            self.fingerprint_store.stamp(station_id, articles)
+            recent = [
+                article for article in articles
+                if self.is_recent(article['published_ts'])
+            ]
+            if len(recent) < len(articles):
+                self.metrics.articles_dropped.inc(len(articles) - len(recent), source=station_id, reason='recency')
+            articles = recent
+            
+            # Add fallback images
+            for article in articles:
+                if not article.get('image'):
+                    article['image'] = self.get_fallback_image(station_config['logo'], self.get_article_hash(article))
+            
+            return [Article.from_dict(article) for article in articles]
+        
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {e}")
+            return None
+
+    async def scrape_station(self, station_id: str) -> Optional[List[Article]]:
+        """
+        Scrape the homepage plus 1-2 random subpages of a single station. Pages not scraped
+        this time (or failing) contribute their last known articles. Returns None if every
+        scraped page failed, so callers can keep the station's previous article set.
+        """
+        station_config = self.stations[station_id]
+        logger.info(f"Scraping {station_config['name']}...")
+        
+        # Randomly select 1-2 subpages per station
+        subpages = station_config.get('subpages', [])
+        num_pages = min(random.randint(1, 2), len(subpages))
+        selected_pages = random.sample(subpages, num_pages) if subpages else []
+        
+        # Add homepage
+        homepage = station_config['homepage']
+        urls_to_scrape = [homepage] + [homepage.rstrip('/') + page for page in selected_pages]
+        all_urls = [homepage] + [homepage.rstrip('/') + page for page in subpages]
+        
+        # Pages share a host, so the scheduler runs them one after another
+        tasks = [asyncio.create_task(self.scrape_url(url, station_id)) for url in urls_to_scrape]
+        try:
+            await asyncio.wait(tasks, timeout=self.station_timeout)
+        finally:
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+        if unfinished:
+            logger.warning(f"{station_config['name']}: {len(unfinished)} pages cut off after {self.station_timeout}s")
+        
+        page_results = [None if task.cancelled() else task.result() for task in tasks]
+        if all(result is None for result in page_results):
+            return None
+        
+        for url, result in zip(urls_to_scrape, page_results):
+            if result is not None:
+                self.page_articles[url] = result
+        
+        # Pages that were not picked (or keep failing) still age out of their last known set
+        cutoff_ts = self.cutoff_ts()
+        for url in all_urls:
+            if url in self.page_articles:
+                self.page_articles[url] = [
+                    article for article in self.page_articles[url] if article.published_ts >= cutoff_ts
+                ]
+        
+        # Check for duplicates across the station's pages
+        articles = []
+        seen_hashes = set()
+        for url in all_urls:
+            for article in self.page_articles.get(url, []):
+                article_hash = self.get_article_hash(article)
+                if article_hash not in seen_hashes:
+                    seen_hashes.add(article_hash)
+                    articles.append(article)
+        return articles
+
+    async def scrape_all_stations(self, station_specific_only: bool = False) -> List[Article]:
         """Scrape all stations with equal treatment and diversity filtering"""
         all_content = []
-        self.seen_hashes.clear()
         
         # Shuffle stations for variety
         station_items = list(self.stations.items())
         random.shuffle(station_items)
         
-        for station_id, station_config in station_items:
-            try:
-                station_name = station_config['name']
-                logger.info(f"Scraping {station_name}...")
-                
-                # Randomly select 1-2 subpages per station
-                subpages = station_config.get('subpages', [])
-                num_pages = min(random.randint(1, 2), len(subpages))
-                selected_pages = random.sample(subpages, num_pages) if subpages else []
-                
-                # Add homepage
-                urls_to_scrape = [station_config['homepage']] + [
-                    station_config['homepage'].rstrip('/') + page for page in selected_pages
-                ]
-                
-                for url in urls_to_scrape:
-                    try:
-                        articles = self.scrape_with_requests(url, station_name, timeout=8)
-                        
-                        # Add fallback images
-                        for article in articles:
-                            if not article.get('image'):
-                                article['image'] = self.get_fallback_image(station_config['logo'])
-                        
-                        all_content.extend(articles)
-                        time.sleep(random.uniform(0.5, 1.5))  # Short delay
-                        
-                    except Exception as e:
-                        logger.error(f"Error scraping {url}: {e}")
-                        continue
-                        
-            except Exception as e:
-                logger.error(f"Error processing station {station_id}: {e}")
+        # Different hosts are scraped in parallel; wall time is bounded by the busiest host
+        station_results = await asyncio.gather(
+            *(self.scrape_station(station_id) for station_id, _ in station_items),
+            return_exceptions=True
+        )
+        
+        for (station_id, _), result in zip(station_items, station_results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing station {station_id}: {result}")
                 continue
+            all_content.extend(result or [])
         
         # Sort by published date (newest first)
-        all_content.sort(key=lambda x: x['published'], reverse=True)
+        all_content.sort(key=lambda x: x['published_ts'], reverse=True)
         
         # Apply diversity filter: max 2 per station in any 10-article window
         diverse_content = self.apply_diversity_filter(all_content, window_size=10, max_per_station=2)
         
         logger.info(f"Total articles collected: {len(diverse_content)}")
         return diverse_content
+
+
+@lru_cache(maxsize=1)
+def _worker_scraper() -> BoiseRadioScraper:
+    return BoiseRadioScraper()
+
+
+def parse_station_page(content: bytes, url: str, station_id: str) -> Tuple[List[Dict], Dict]:
+    """
+    Parse-pool job: turn a raw station page into plain article dicts, plus stats for the parent:
+    drop counts by reason, parse time and per-stage time totals.
+    """
+    start = time.perf_counter()
+    dropped = Counter()
+    scraper = _worker_scraper()
+    station_config = scraper.stations[station_id]
+    with tracer.collect_stages() as stages:
+        articles = scraper.parse_page(
+            content,
+            url,
+            station_config['name'],
+            station_config.get('engine', scraper.default_engine),
+            station_id,
+            dropped
+        )
+    return articles, {'dropped': dict(dropped), 'seconds': time.perf_counter() - start, 'stages': stages}
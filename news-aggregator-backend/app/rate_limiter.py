@@ -0,0 +1,20 @@
+from typing import Dict, Optional
+import time
+
+
+class RateLimiter:
+    """Allow an action at most once per min_interval_seconds for each key"""
+
+    def __init__(self, min_interval_seconds: float):
+        self.min_interval_seconds = min_interval_seconds
+        self.last_allowed: Dict[str, float] = {}
+
+    def try_acquire(self, key: str) -> Optional[float]:
+        """None if the action may run now (and records it), else seconds until it may"""
+        now = time.monotonic()
+        last = self.last_allowed.get(key)
+        if last is not None and now - last < self.min_interval_seconds:
+            return self.min_interval_seconds - (now - last)
+
+        self.last_allowed[key] = now
+        return None
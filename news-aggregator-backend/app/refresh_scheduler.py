@@ -0,0 +1,122 @@
+from statistics import median
+from typing import Dict, Iterable, List, Optional
+import random
+import time
+
+from app.article import Article
+
+
+class SourceSchedule:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_due = 0.0
+        self.url_set: Optional[frozenset] = None
+        self.cadence: Optional[float] = None
+        # Exponentially weighted share of fetches that returned the same article set (304s included)
+        self.unchanged_rate = 0.0
+        self.fetches = 0
+        self.failures = 0
+
+
+class RefreshScheduler:
+    """
+    Per-source next-due times instead of one fixed cycle for every source.
+
+    After each fetch a source's interval grows by `backoff` if its article set was unchanged
+    (a 304 returns the same articles) and shrinks by `speedup` if it changed. It is then capped
+    at the source's publish cadence (median gap between its recent articles) and clamped to
+    [min_interval, max_interval]. Due times get +/- `jitter` so sources drift apart.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 15 * 60,
+        max_interval: float = 12 * 3600,
+        initial_interval: float = 3600,
+        backoff: float = 1.5,
+        speedup: float = 0.5,
+        jitter: float = 0.1,
+        cadence_samples: int = 10
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.initial_interval = initial_interval
+        self.backoff = backoff
+        self.speedup = speedup
+        self.jitter = jitter
+        self.cadence_samples = cadence_samples
+        self.sources: Dict[str, SourceSchedule] = {}
+        self.random = random.Random()
+
+    def publish_cadence(self, articles: List[Article]) -> Optional[float]:
+        """Median gap in seconds between the source's most recent distinct publish times"""
+        timestamps = sorted({article.published_ts for article in articles if article.published_ts}, reverse=True)
+        timestamps = timestamps[:self.cadence_samples]
+        if len(timestamps) < 2:
+            return None
+        return median(newer - older for newer, older in zip(timestamps, timestamps[1:]))
+
+    def record(self, source_id: str, articles: Optional[List[Article]], now: Optional[float] = None):
+        """Adapt source_id's interval to one fetch result (None = failed) and schedule its next fetch"""
+        now = time.monotonic() if now is None else now
+        schedule = self.sources.get(source_id)
+        if schedule is None:
+            schedule = self.sources[source_id] = SourceSchedule(self.initial_interval)
+
+        if articles is None:
+            # A failure says nothing about cadence; retry after the current interval
+            schedule.failures += 1
+        else:
+            url_set = frozenset(article.url for article in articles)
+            if schedule.url_set is not None:
+                unchanged = url_set == schedule.url_set
+                schedule.unchanged_rate = 0.7 * schedule.unchanged_rate + 0.3 * unchanged
+                schedule.interval *= self.backoff if unchanged else self.speedup
+            schedule.url_set = url_set
+            schedule.fetches += 1
+
+            schedule.cadence = self.publish_cadence(articles)
+            if schedule.cadence is not None:
+                schedule.interval = min(schedule.interval, schedule.cadence)
+            schedule.interval = min(max(schedule.interval, self.min_interval), self.max_interval)
+
+        spread = self.random.uniform(1 - self.jitter, 1 + self.jitter)
+        schedule.next_due = now + schedule.interval * spread
+
+    def postpone(self, source_id: str, seconds: float, now: Optional[float] = None):
+        """Push source_id's next fetch back by at least `seconds` without adapting its interval"""
+        now = time.monotonic() if now is None else now
+        schedule = self.sources.get(source_id)
+        if schedule is None:
+            schedule = self.sources[source_id] = SourceSchedule(self.initial_interval)
+        schedule.next_due = max(schedule.next_due, now + seconds)
+
+    def due(self, source_ids: Iterable[str], within: float = 0, now: Optional[float] = None) -> List[str]:
+        """Sources due in the next `within` seconds; never-fetched sources are always due"""
+        horizon = (time.monotonic() if now is None else now) + within
+        return [
+            source_id for source_id in source_ids
+            if source_id not in self.sources or self.sources[source_id].next_due <= horizon
+        ]
+
+    def seconds_until_due(self, source_ids: Iterable[str], now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        next_due = min(
+            (self.sources[source_id].next_due if source_id in self.sources else now for source_id in source_ids),
+            default=now + self.max_interval
+        )
+        return max(next_due - now, 0)
+
+    def get_stats(self) -> Dict:
+        now = time.monotonic()
+        return {
+            source_id: {
+                'interval_seconds': int(schedule.interval),
+                'next_due_seconds': max(int(schedule.next_due - now), 0),
+                'publish_cadence_seconds': int(schedule.cadence) if schedule.cadence is not None else None,
+                'unchanged_rate': round(schedule.unchanged_rate, 2),
+                'fetches': schedule.fetches,
+                'failures': schedule.failures
+            }
+            for source_id, schedule in self.sources.items()
+        }
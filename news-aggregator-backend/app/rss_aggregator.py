@@ -1,18 +1,31 @@
 import feedparser
-import requests
 from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 from dateutil import parser as date_parser
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+import asyncio
 import re
 import logging
+import time
+
+from app.article import Article
+from app.conditional_cache import ConditionalGetCache
+from app.fetch_engine import FetchEngine
+from app.fingerprint_store import fingerprint_store
+from app.http_client import http_client
+from app.metrics import pipeline_metrics
+from app.parse_pool import parse_pool
+from app.timestamps import set_published, to_utc
+from app.tracer import tracer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 class RSSAggregator:
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 5, source_timeout: float = 20):
         self.sources = {
             'newscaststudio': {
                 'name': 'NewscastStudio',
@@ -69,57 +82,141 @@ class RSSAggregator:
                 'priority': 1
             },
         }
+        
+        # All feeds are pulled concurrently; a cycle lasts about as long as the slowest feed
+        self.fetch_engine = FetchEngine(max_concurrency=max_concurrency, source_timeout=source_timeout)
+        
+        self.http_client = http_client
+        self.parse_pool = parse_pool
+        
+        # ETag/Last-Modified validators; a 304 reuses the previously parsed articles
+        self.conditional_cache = ConditionalGetCache()
+        
+        # Cross-cycle first-seen times; undated entries keep the time they first appeared
+        self.fingerprint_store = fingerprint_store
+        
+        self.metrics = pipeline_metrics
+        self.tracer = tracer
 
-    def fetch_rss_feed(self, url: str, source_name: str) -> List[Dict]:
-        try:
-            logger.info(f"Fetching RSS feed from {source_name}: {url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            feed = feedparser.parse(response.content)
-            
-            if not feed.entries:
-                logger.warning(f"No entries found in feed from {source_name}")
-                return []
-            
-            articles = []
-            cutoff_date = datetime.now() - timedelta(hours=48)
-            
-            for entry in feed.entries:
-                try:
-                    pub_date = self.parse_date(entry)
-                    
-                    if pub_date and pub_date < cutoff_date:
-                        continue
-                    
-                    article = {
-                        'title': self.clean_text(entry.get('title', 'No title')),
-                        'description': self.extract_description(entry),
-                        'url': entry.get('link', ''),
-                        'published': pub_date.isoformat() if pub_date else datetime.now().isoformat(),
-                        'source': source_name,
-                        'image': self.extract_image(entry),
-                        'content_type': 'news'
-                    }
-                    
-                    if article['title'] and len(article['title']) > 10:
-                        articles.append(article)
-                        
-                except Exception as e:
-                    logger.error(f"Error processing entry from {source_name}: {e}")
-                    continue
-            
-            logger.info(f"Successfully fetched {len(articles)} articles from {source_name}")
-            return articles
-            
-        except Exception as e:
-            logger.error(f"Error fetching RSS from {source_name}: {e}")
+    async def fetch_rss_feed(self, url: str, source_name: str, timeout: float = 30, source_id: Optional[str] = None) -> List[Article]:
+        """Fetch and parse one feed; network and HTTP errors propagate to the caller"""
+        logger.info(f"Fetching RSS feed from {source_name}: {url}")
+        
+        headers = self.conditional_cache.request_headers(url)
+        source_label = source_id or source_name
+        
+        with self.tracer.span('http', url=url) as span:
+            started = time.perf_counter()
+            response = await self.http_client.get(url, headers=headers, timeout=timeout)
+            self.metrics.fetch_seconds.observe(time.perf_counter() - started, source=source_label)
+            span.update(status=response.status_code, bytes=response.num_bytes_downloaded)
+        cutoff_ts = self.cutoff_ts()
+        
+        self.metrics.http_responses.inc(source=source_label, status=response.status_code)
+        self.metrics.bytes_downloaded.inc(response.num_bytes_downloaded, source=source_label)
+        
+        if response.status_code == 304:
+            cached_articles = self.conditional_cache.hit(url)
+            if cached_articles is not None:
+                self.fingerprint_store.stamp(source_label, cached_articles)
+                articles = self.drop_expired(cached_articles, cutoff_ts, source_label)
+                logger.info(f"{source_name} not modified, reusing {len(articles)} cached articles")
+                return articles
+        
+        response.raise_for_status()
+        
+        # feedparser and BeautifulSoup are CPU-bound, so parsing happens off the event loop
+        with self.tracer.span('parse') as span:
+            articles, stats = await self.parse_pool.run(parse_feed_content, response.content, source_name)
+            self.tracer.add_stages(stats['stages'], stats['seconds'])
+            span.update(articles=len(articles))
+        self.metrics.parse_seconds.observe(stats['seconds'], source=source_label)
+        self.metrics.record_drops(source_label, stats['dropped'])
+        
+        # Undated entries are stamped with their first-seen time, then expire like dated ones
+        self.fingerprint_store.stamp(source_label, articles)
+        articles = [Article.from_dict(article) for article in self.drop_expired(articles, cutoff_ts, source_label)]
+        
+        self.conditional_cache.store(url, response.headers, len(response.content), articles)
+        
+        logger.info(f"Successfully fetched {len(articles)} articles from {source_name}")
+        return articles
+
+    def is_fetching(self, source_id: str) -> bool:
+        """Whether the feed's fetch has started, rather than still waiting for a concurrency slot"""
+        return source_id in self.fetch_engine.running
+
+    async def fetch_source(self, source_id: str) -> Optional[List[Article]]:
+        """Fetch one configured feed under the engine's limits; None if it failed or timed out"""
+        source_config = self.sources[source_id]
+        return await self.fetch_engine.fetch(
+            source_id,
+            lambda: self.fetch_rss_feed(
+                source_config['rss_url'],
+                source_config['name'],
+                self.fetch_engine.source_timeout,
+                source_id
+            )
+        )
+
+    def parse_feed(self, content: bytes, source_name: str, dropped: Optional[Counter] = None) -> List[Dict]:
+        """Article dicts from a feed body; skipped entries are counted by reason in `dropped`"""
+        if dropped is None:
+            dropped = Counter()
+        with tracer.stage('feedparser'):
+            feed = feedparser.parse(content)
+        
+        if not feed.entries:
+            logger.warning(f"No entries found in feed from {source_name}")
             return []
+        
+        articles = []
+        cutoff_date = datetime.now(timezone.utc) - timedelta(hours=48)
+        
+        for entry in feed.entries:
+            try:
+                pub_date = self.parse_date(entry)
+                if pub_date:
+                    pub_date = to_utc(pub_date)
+                
+                if pub_date and pub_date < cutoff_date:
+                    dropped['recency'] += 1
+                    continue
+                
+                article = {
+                    'title': self.clean_text(entry.get('title', 'No title')),
+                    'description': self.extract_description(entry),
+                    'url': entry.get('link', ''),
+                    # Undated: the parent stamps the first-seen time from the fingerprint store
+                    'published': None,
+                    'published_ts': None,
+                    'source': source_name,
+                    'image': self.extract_image(entry),
+                    'content_type': 'news'
+                }
+                if pub_date:
+                    set_published(article, pub_date)
+                
+                if article['title'] and len(article['title']) > 10:
+                    articles.append(article)
+                else:
+                    dropped['short_title'] += 1
+                    
+            except Exception as e:
+                logger.error(f"Error processing entry from {source_name}: {e}")
+                continue
+        
+        return articles
+
+    def cutoff_ts(self) -> int:
+        """Oldest published_ts still kept: feed articles expire after 48 hours"""
+        return int(time.time()) - 48 * 3600
+
+    def drop_expired(self, articles: List, cutoff_ts: int, source_label: Optional[str] = None) -> List:
+        kept = [article for article in articles if article['published_ts'] >= cutoff_ts]
+        if source_label and len(kept) < len(articles):
+            self.metrics.articles_dropped.inc(len(articles) - len(kept), source=source_label, reason='recency')
+        return kept
 
     def parse_date(self, entry: Dict) -> Optional[datetime]:
         date_fields = ['published_parsed', 'updated_parsed', 'created_parsed']
@@ -137,11 +234,12 @@ class RSSAggregator:
         for field in date_strings:
             if field in entry:
                 try:
-                    return date_parser.parse(entry[field])
+                    with tracer.stage('dateutil'):
+                        return date_parser.parse(entry[field])
                 except:
                     pass
         
-        return datetime.now()
+        return None
 
     def extract_description(self, entry: Dict) -> str:
         description = ''
@@ -190,8 +288,9 @@ class RSSAggregator:
         if not text:
             return ""
         
-        soup = BeautifulSoup(text, 'html.parser')
-        return soup.get_text()
+        with tracer.stage('beautifulsoup'):
+            soup = BeautifulSoup(text, 'html.parser')
+            return soup.get_text()
 
     def clean_text(self, text: str) -> str:
         if not text:
@@ -204,20 +303,31 @@ class RSSAggregator:
         
         return text.strip()
 
-    async def aggregate_all(self) -> List[Dict]:
-        all_articles = []
+    async def aggregate_all(self) -> List[Article]:
+        self.conditional_cache.start_cycle()
+        results = await asyncio.gather(*(self.fetch_source(source_id) for source_id in self.sources))
         
-        for source_id, source_config in self.sources.items():
-            try:
-                articles = self.fetch_rss_feed(
-                    source_config['rss_url'],
-                    source_config['name']
-                )
-                all_articles.extend(articles)
-            except Exception as e:
-                logger.error(f"Error processing source {source_id}: {e}")
-                continue
+        all_articles = []
+        for articles in results:
+            all_articles.extend(articles or [])
         
-        all_articles.sort(key=lambda x: x['published'], reverse=True)
+        all_articles.sort(key=lambda x: x['published_ts'], reverse=True)
         
         return all_articles
+
+
+@lru_cache(maxsize=1)
+def _worker_aggregator() -> RSSAggregator:
+    return RSSAggregator()
+
+
+def parse_feed_content(content: bytes, source_name: str) -> Tuple[List[Dict], Dict]:
+    """
+    Parse-pool job: turn a raw feed body into plain article dicts, plus stats for the parent:
+    drop counts by reason, parse time and per-stage time totals.
+    """
+    start = time.perf_counter()
+    dropped = Counter()
+    with tracer.collect_stages() as stages:
+        articles = _worker_aggregator().parse_feed(content, source_name, dropped)
+    return articles, {'dropped': dict(dropped), 'seconds': time.perf_counter() - start, 'stages': stages}
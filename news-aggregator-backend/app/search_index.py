@@ -0,0 +1,102 @@
+from bisect import bisect_left, insort
+from heapq import nlargest
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from app.aggregator_service import AggregatorService
+from app.article import Article
+
+
+def tokenize(text: str) -> List[str]:
+    return AggregatorService.normalize_title(text).split()
+
+
+class SearchIndex:
+    """
+    Inverted index over the title and description tokens of every visible merged-view article.
+
+    It is maintained from the merged view's (added, removed) deltas, so a cache update costs
+    O(changed articles). Terms are ANDed; the last term (or any term ending in '*') matches
+    as a prefix through a sorted vocabulary. Results are ranked newest first.
+    """
+
+    def __init__(self):
+        self.docs: Dict[int, Article] = {}
+        self.doc_tokens: Dict[int, FrozenSet[str]] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self.vocabulary: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def apply(self, added: List[Article], removed: List[Article]):
+        for article in removed:
+            self.remove(article)
+        for article in added:
+            self.add(article)
+
+    def add(self, article: Article):
+        # Keyed by object identity: the index keeps the article alive until it is removed
+        doc_id = id(article)
+        if doc_id in self.docs:
+            return
+
+        tokens = frozenset(tokenize(f"{article.title} {article.description}"))
+        self.docs[doc_id] = article
+        self.doc_tokens[doc_id] = tokens
+        for token in tokens:
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = set()
+                insort(self.vocabulary, token)
+            postings.add(doc_id)
+
+    def remove(self, article: Article):
+        doc_id = id(article)
+        if doc_id not in self.docs:
+            return
+
+        del self.docs[doc_id]
+        for token in self.doc_tokens.pop(doc_id):
+            postings = self.postings[token]
+            postings.discard(doc_id)
+            if not postings:
+                del self.postings[token]
+                del self.vocabulary[bisect_left(self.vocabulary, token)]
+
+    def prefix_matches(self, prefix: str) -> Set[int]:
+        matches = set()
+        index = bisect_left(self.vocabulary, prefix)
+        while index < len(self.vocabulary) and self.vocabulary[index].startswith(prefix):
+            matches.update(self.postings[self.vocabulary[index]])
+            index += 1
+        return matches
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> Tuple[List[Article], int]:
+        """(newest-first matches up to limit, total number of matches)"""
+        terms = []
+        for raw_term in query.split():
+            terms.extend((term, raw_term.endswith('*')) for term in tokenize(raw_term))
+        if not terms:
+            return [], 0
+        if prefix:
+            terms[-1] = (terms[-1][0], True)
+
+        exact_sets = sorted((self.postings.get(term, set()) for term, is_prefix in terms if not is_prefix), key=len)
+        prefixes = [term for term, is_prefix in terms if is_prefix]
+
+        matches = None
+        for candidates in exact_sets:
+            matches = set(candidates) if matches is None else matches & candidates
+            if not matches:
+                return [], 0
+
+        for term in prefixes:
+            if matches is None:
+                matches = self.prefix_matches(term)
+            else:
+                # Already narrowed by exact terms: check those documents instead of expanding the prefix
+                matches = {doc_id for doc_id in matches if any(token.startswith(term) for token in self.doc_tokens[doc_id])}
+
+        docs = self.docs
+        newest = nlargest(limit, matches, key=lambda doc_id: (docs[doc_id].published_ts, docs[doc_id].url))
+        return [docs[doc_id] for doc_id in newest], len(matches)
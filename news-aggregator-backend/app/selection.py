@@ -0,0 +1,70 @@
+from collections import deque
+from math import ceil
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+
+class DiversitySelector:
+    """
+    Single-pass, streaming selection over candidates that are already in display order.
+
+    - Window rule: a source appears at most max_per_window times among the last
+      window_size selected items. A deque of those sources plus a per-source counter
+      make each check O(1).
+    - Weighted quotas (optional): with `weights` and `limit`, a source may take at most
+      ceil(weight / total_weight * limit) of the limit slots. Sources without a weight
+      are not quota-limited.
+
+    select() is a generator, so it can sit on top of any iterable and stops pulling
+    candidates once `limit` items are selected.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 10,
+        max_per_window: int = 2,
+        weights: Optional[Dict[str, float]] = None,
+        limit: Optional[int] = None,
+        key: Callable[[Dict], str] = lambda article: article['source']
+    ):
+        self.window_size = window_size
+        self.max_per_window = max_per_window
+        self.limit = limit
+        self.key = key
+
+        self.quotas: Dict[str, int] = {}
+        if weights and limit:
+            total_weight = sum(weights.values())
+            self.quotas = {
+                # Multiplied first, so exact shares stay exact (7 / 25 * 100 rounds up to 29)
+                source: ceil(weight * limit / total_weight)
+                for source, weight in weights.items()
+            }
+
+    def select(self, candidates: Iterable[Dict]) -> Iterator[Dict]:
+        window = deque()
+        in_window: Dict[str, int] = {}
+        taken: Dict[str, int] = {}
+        selected = 0
+        if self.limit is not None and self.limit <= 0:
+            return
+
+        for candidate in candidates:
+            source = self.key(candidate)
+            if in_window.get(source, 0) >= self.max_per_window:
+                continue
+            quota = self.quotas.get(source)
+            if quota is not None and taken.get(source, 0) >= quota:
+                continue
+
+            yield candidate
+            selected += 1
+            taken[source] = taken.get(source, 0) + 1
+
+            window.append(source)
+            in_window[source] = in_window.get(source, 0) + 1
+            if len(window) > self.window_size:
+                expired = window.popleft()
+                in_window[expired] -= 1
+
+            if self.limit is not None and selected >= self.limit:
+                return
@@ -0,0 +1,122 @@
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+import json
+import logging
+import os
+
+from app.article import dumps
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; multi-worker mode needs it
+    fcntl = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SharedState:
+    """
+    Multi-worker mode (enabled by SHARED_STATE_DIR): one worker holds an exclusive lock on
+    updater.lock and is the only one that fetches sources; it writes every published
+    version to snapshot.json atomically. The other workers follow that file: a stat() per
+    poll tells them whether it was replaced, and only then is it read and applied.
+
+    The lock is released by the OS when the updater exits, so a follower takes over.
+    Without SHARED_STATE_DIR the process is always the updater and nothing is written.
+    """
+
+    def __init__(self, directory: Optional[str], poll_seconds: float = 1.0):
+        if directory and fcntl is None:
+            logger.warning("SHARED_STATE_DIR is set but fcntl is unavailable; running single-worker")
+            directory = None
+
+        self.directory = directory
+        self.enabled = directory is not None
+        self.poll_seconds = poll_seconds
+        self.lock_path = os.path.join(directory, 'updater.lock') if directory else None
+        self.snapshot_path = os.path.join(directory, 'snapshot.json') if directory else None
+        self.lock_file = None
+        self.is_leader = not self.enabled
+        # (inode, mtime, size) of the snapshot file last read or written by this worker
+        self.signature: Optional[Tuple[int, int, int]] = None
+        self.loaded_version = 0
+
+    @staticmethod
+    def file_signature(stat: os.stat_result) -> Tuple[int, int, int]:
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def try_become_leader(self) -> bool:
+        """Take the updater lock if no other worker holds it (non-blocking)"""
+        if self.is_leader:
+            return True
+
+        if self.lock_file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self.lock_file = open(self.lock_path, 'a+')
+        try:
+            fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+
+        self.is_leader = True
+        logger.info(f"Worker {os.getpid()} is now the updater")
+        return True
+
+    def release(self):
+        if self.lock_file is not None:
+            self.lock_file.close()
+            self.lock_file = None
+        self.is_leader = not self.enabled
+
+    def changed(self) -> bool:
+        """Whether snapshot.json was replaced since this worker last read or wrote it"""
+        try:
+            return self.file_signature(os.stat(self.snapshot_path)) != self.signature
+        except FileNotFoundError:
+            return False
+
+    def write_snapshot(self, version: int, last_updated: datetime, sources: Dict[str, Dict]):
+        """Replace snapshot.json atomically (blocking; call from a thread)"""
+        body = dumps({
+            'version': version,
+            'last_updated': last_updated.isoformat(),
+            'sources': sources
+        })
+
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+            signature = self.file_signature(os.fstat(f.fileno()))
+        os.replace(tmp_path, self.snapshot_path)
+
+        self.signature = signature
+        self.loaded_version = version
+
+    def read_snapshot(self) -> Optional[Dict]:
+        """The latest snapshot.json, or None if there is none (blocking; call from a thread)"""
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                # Signature of the file actually read, not of whatever replaces it meanwhile
+                signature = self.file_signature(os.fstat(f.fileno()))
+                snapshot = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+
+        self.signature = signature
+        self.loaded_version = snapshot['version']
+        return snapshot
+
+    def get_stats(self) -> Dict:
+        return {
+            'enabled': self.enabled,
+            'role': 'updater' if self.is_leader else 'follower',
+            'worker_pid': os.getpid(),
+            'snapshot_version': self.loaded_version
+        }
+
+
+shared_state = SharedState(os.environ.get('SHARED_STATE_DIR'))
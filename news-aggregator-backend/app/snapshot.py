@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Dict, Optional
+import gzip
+import hashlib
+
+import brotli
+
+from app.article import dumps
+
+
+class RenderedSnapshot:
+    """
+    One cache version serialized once: immutable JSON bytes plus gzip/brotli variants,
+    ready to be written to the socket as-is.
+    """
+
+    def __init__(self, version: int, payload: Dict, last_updated: datetime):
+        self.version = version
+        self.last_updated = last_updated
+
+        body = dumps(payload)
+        self.bodies: Dict[str, bytes] = {
+            'identity': body,
+            'gzip': gzip.compress(body, compresslevel=9, mtime=0),
+            'br': brotli.compress(body, quality=9),
+        }
+
+        self.etag = f'"{version}-{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+    def choose_encoding(self, accept_encoding: Optional[str]) -> str:
+        """Smallest variant the client accepts (q=0 means refused)"""
+        accepted = set()
+        for part in (accept_encoding or '').lower().split(','):
+            coding, _, params = part.strip().partition(';')
+            if params.strip().replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+                continue
+            accepted.add(coding.strip())
+
+        for encoding in ('br', 'gzip'):
+            if encoding in self.bodies and (encoding in accepted or '*' in accepted):
+                return encoding
+        return 'identity'
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+from typing import Dict
+
+from dateutil import parser as date_parser
+
+
+def to_utc(value: datetime) -> datetime:
+    """Aware datetimes are converted; naive ones are taken as UTC (feedparser's *_parsed already are)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def set_published(article: Dict, value: datetime) -> Dict:
+    """
+    Set both the UTC ISO 'published' string and the integer 'published_ts' (epoch seconds).
+    Sorting, recency cutoffs and windowing use published_ts and never re-parse the string.
+    """
+    value = to_utc(value)
+    article['published'] = value.isoformat()
+    article['published_ts'] = int(value.timestamp())
+    return article
+
+
+def ensure_published_ts(article: Dict) -> Dict:
+    """Backfill published_ts on articles ingested before it existed (e.g. restored from the store)"""
+    if article.get('published_ts') is None:
+        try:
+            set_published(article, date_parser.parse(article['published']))
+        except (KeyError, TypeError, ValueError, OverflowError):
+            article['published_ts'] = 0
+    return article
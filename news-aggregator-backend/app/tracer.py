@@ -0,0 +1,156 @@
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import time
+
+# (trace being recorded, track of the enclosing span); copied into every task a cycle spawns
+_current: ContextVar[Optional[Tuple['Trace', str]]] = ContextVar('trace_current', default=None)
+# Stage totals being collected by a parse job: name -> [seconds, calls]
+_stages: ContextVar[Optional[Dict[str, List]]] = ContextVar('trace_stages', default=None)
+
+
+class Trace:
+    def __init__(self, cycle: str):
+        self.cycle = cycle
+        self.started_at = datetime.now()
+        self.origin = time.perf_counter()
+        self.duration = 0.0
+        self.spans: List[Dict[str, Any]] = []
+
+    def add_span(self, name: str, track: str, start: float, duration: float, attrs: Dict[str, Any]):
+        # Rounded at both ends, so consecutive spans stay adjacent instead of overlapping by a rounding step
+        start_ms = round((start - self.origin) * 1000, 3)
+        end_ms = round((start + duration - self.origin) * 1000, 3)
+        self.spans.append({
+            'name': name,
+            'track': track,
+            'start_ms': start_ms,
+            'duration_ms': round(end_ms - start_ms, 3),
+            **attrs
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'cycle': self.cycle,
+            'started_at': self.started_at.isoformat(),
+            'duration_ms': round(self.duration * 1000, 3),
+            'spans': sorted(self.spans, key=lambda span: span['start_ms'])
+        }
+
+
+class Tracer:
+    """
+    Span timings for refresh cycles, kept for the last max_traces cycles.
+
+    cycle() starts a trace; span() records a named stage of it on a track (a source, or
+    'cycle' for publish stages), inherited by nested spans and by tasks the cycle spawns.
+    Outside a cycle span() does nothing. Parse pool jobs can't add spans across the process
+    boundary, so they total their stages with stage() and the parent lays them out with
+    add_stages() inside its parse span.
+    """
+
+    def __init__(self, max_traces: int = 20):
+        self.traces: deque = deque(maxlen=max_traces)
+
+    @contextmanager
+    def cycle(self, name: str) -> Iterator[Trace]:
+        trace = Trace(name)
+        token = _current.set((trace, 'cycle'))
+        try:
+            yield trace
+        finally:
+            _current.reset(token)
+            trace.duration = time.perf_counter() - trace.origin
+            self.traces.append(trace)
+
+    @contextmanager
+    def span(self, name: str, track: Optional[str] = None, **attrs: Any) -> Iterator[Dict[str, Any]]:
+        """Time the block; the yielded dict takes attributes known only afterwards (status, counts)"""
+        current = _current.get()
+        if current is None:
+            yield attrs
+            return
+
+        trace, parent_track = current
+        track = track or parent_track
+        token = _current.set((trace, track))
+        start = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            _current.reset(token)
+            trace.add_span(name, track, start, time.perf_counter() - start, attrs)
+
+    @contextmanager
+    def collect_stages(self) -> Iterator[Dict[str, List]]:
+        stages: Dict[str, List] = {}
+        token = _stages.set(stages)
+        try:
+            yield stages
+        finally:
+            _stages.reset(token)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Add the block's time to `name` in the enclosing collect_stages(), if any"""
+        stages = _stages.get()
+        if stages is None:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            totals = stages.setdefault(name, [0.0, 0])
+            totals[0] += time.perf_counter() - start
+            totals[1] += 1
+
+    def add_stages(self, stages: Dict[str, List], total: float):
+        """Lay out stage totals from a parse job as consecutive spans ending now"""
+        current = _current.get()
+        if current is None:
+            return
+
+        trace, track = current
+        cursor = time.perf_counter() - total
+        for name, (seconds, calls) in stages.items():
+            trace.add_span(name, track, cursor, seconds, {'calls': calls, 'aggregated': True})
+            cursor += seconds
+
+    def recent(self, limit: Optional[int] = None) -> List[Trace]:
+        """Finished traces, newest first"""
+        traces = list(reversed(self.traces))
+        return traces if limit is None else traces[:limit]
+
+    @staticmethod
+    def to_chrome(traces: List[Trace]) -> Dict[str, Any]:
+        """Chrome trace-event JSON (chrome://tracing, Perfetto): one process per cycle, one thread per track"""
+        events = []
+        for pid, trace in enumerate(traces, start=1):
+            events.append({
+                'name': 'process_name', 'ph': 'M', 'pid': pid,
+                'args': {'name': f"{trace.cycle} cycle {trace.started_at.isoformat(timespec='seconds')}"}
+            })
+            tids = {'cycle': 0}
+            for span in trace.spans:
+                tids.setdefault(span['track'], len(tids))
+            for track, tid in tids.items():
+                events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': track}})
+
+            events.append({
+                'name': trace.cycle, 'cat': 'cycle', 'ph': 'X', 'pid': pid, 'tid': 0,
+                'ts': 0, 'dur': round(trace.duration * 1_000_000)
+            })
+            for span in trace.spans:
+                args = {key: value for key, value in span.items() if key not in ('name', 'track', 'start_ms', 'duration_ms')}
+                events.append({
+                    'name': span['name'], 'cat': span['track'], 'ph': 'X', 'pid': pid, 'tid': tids[span['track']],
+                    'ts': round(span['start_ms'] * 1000), 'dur': round(span['duration_ms'] * 1000), 'args': args
+                })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+tracer = Tracer()
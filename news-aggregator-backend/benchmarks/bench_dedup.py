@@ -0,0 +1,87 @@
+"""
+Compare AggregatorService.remove_duplicates (near-duplicate index) with the previous
+pairwise scan over every seen title, at 1k, 10k and 100k synthetic titles.
+
+Run from news-aggregator-backend/:
+
+    python -m benchmarks.bench_dedup [sizes ...]
+
+The pairwise scan is quadratic, so it only runs up to 10k titles; where both run,
+their outputs are checked to be identical.
+"""
+import logging
+import random
+import sys
+import time
+
+from app.aggregator_service import AggregatorService
+
+PAIRWISE_LIMIT = 10_000
+
+VOCABULARY = [
+    'radio', 'station', 'fcc', 'broadcast', 'boise', 'idaho', 'concert', 'tickets', 'win',
+    'morning', 'show', 'host', 'ratings', 'nielsen', 'podcast', 'streaming', 'am', 'fm',
+    'license', 'sale', 'acquires', 'iheartmedia', 'cumulus', 'audacy', 'tv', 'news',
+    'the', 'a', 'to', 'for', 'in', 'of', 'and', 'new', 'after', 'with', 'announces',
+]
+
+
+def synthetic_articles(count: int, seed: int = 42) -> list:
+    """Titles of 6-12 words over a small vocabulary; ~30% are one-word edits of an earlier title"""
+    rng = random.Random(seed)
+    words = VOCABULARY + [f'term{i}' for i in range(count // 4)]
+    articles = []
+    for i in range(count):
+        if articles and rng.random() < 0.3:
+            title = rng.choice(articles)['title'].split()
+            title[rng.randrange(len(title))] = rng.choice(words)
+        else:
+            title = [rng.choice(words) for _ in range(rng.randint(6, 12))]
+        articles.append({'title': ' '.join(title).title(), 'url': f'https://example.com/story-{i}'})
+    return articles
+
+
+def pairwise_remove_duplicates(articles: list) -> list:
+    """The previous O(n^2) implementation, kept here as the baseline"""
+    unique_articles = []
+    seen_urls = set()
+    seen_titles = set()
+    for article in articles:
+        url = article.get('url', '')
+        if url and url in seen_urls:
+            continue
+        normalized_title = AggregatorService.normalize_title(article.get('title', ''))
+        if not any(AggregatorService.titles_are_similar(normalized_title, seen) for seen in seen_titles):
+            unique_articles.append(article)
+            if url:
+                seen_urls.add(url)
+            seen_titles.add(normalized_title)
+    return unique_articles
+
+
+def timed(func, articles: list):
+    start = time.perf_counter()
+    result = func(articles)
+    return result, time.perf_counter() - start
+
+
+def main(sizes: list):
+    logging.getLogger('app.aggregator_service').setLevel(logging.WARNING)
+
+    for size in sizes:
+        articles = synthetic_articles(size)
+        indexed, indexed_seconds = timed(AggregatorService.remove_duplicates, articles)
+        print(f"{size:>7} titles")
+        print(f"  indexed:  {indexed_seconds:8.3f}s  ({len(indexed)} unique)")
+
+        if size <= PAIRWISE_LIMIT:
+            pairwise, pairwise_seconds = timed(pairwise_remove_duplicates, articles)
+            same = [a['url'] for a in pairwise] == [a['url'] for a in indexed]
+            print(f"  pairwise: {pairwise_seconds:8.3f}s  ({len(pairwise)} unique)  "
+                  f"x{pairwise_seconds / indexed_seconds:.1f}  {'identical' if same else 'MISMATCH'}")
+        else:
+            print(f"  pairwise: skipped above {PAIRWISE_LIMIT} titles")
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,71 @@
+"""
+Compare station-page extraction throughput of the BeautifulSoup and lxml engines,
+and of the compiled WordPress station profile.
+
+Run from news-aggregator-backend/:
+
+    python -m benchmarks.bench_extractors [saved_page.html ...]
+
+Without arguments a synthetic WordPress-style page is used.
+"""
+from datetime import datetime
+import sys
+import time
+
+from app.extractors import ProfileExtractor
+from app.radio_scraper import WORDPRESS_PROFILE, BoiseRadioScraper
+
+
+def synthetic_page(articles: int = 20, filler_divs: int = 300) -> bytes:
+    published = datetime.now().isoformat()
+    filler = ''.join(
+        f'<div class="widget menu-{i}"><ul><li><a href="/nav/{i}">Link {i}</a></li></ul></div>'
+        for i in range(filler_divs)
+    )
+    items = ''.join(
+        f'<article class="post type-post entry card-{i}">'
+        f'<h2 class="entry-title"><a href="/2025/story-{i}/">Win tickets to see the big summer concert {i}</a></h2>'
+        f'<img src="/wp-content/uploads/story-{i}.jpg">'
+        f'<div class="entry-summary"><p>Enter to win a pair of tickets for show {i} this weekend.</p></div>'
+        f'<time class="entry-date published" datetime="{published}">{published}</time>'
+        f'</article>'
+        for i in range(articles)
+    )
+    return f'<html><head><title>Station</title></head><body>{filler}<main>{items}</main>{filler}</body></html>'.encode()
+
+
+# No registry station has a profile yet, so the benchmark registers its own
+PROFILE_STATION = 'benchmark'
+
+
+def pages_per_second(scraper: BoiseRadioScraper, page: bytes, engine: str, station_id=None, min_seconds: float = 2.0) -> float:
+    iterations = 0
+    start = time.perf_counter()
+    while True:
+        scraper.parse_page(page, 'https://station.example/', 'Benchmark FM', engine, station_id)
+        iterations += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return iterations / elapsed
+
+
+def main(paths: list):
+    scraper = BoiseRadioScraper()
+    scraper.extraction_profiles[PROFILE_STATION] = ProfileExtractor(WORDPRESS_PROFILE)
+    pages = {path: open(path, 'rb').read() for path in paths} or {'synthetic': synthetic_page()}
+
+    for label, page in pages.items():
+        soup_rate = pages_per_second(scraper, page, 'soup')
+        lxml_rate = pages_per_second(scraper, page, 'lxml')
+        profile_rate = pages_per_second(scraper, page, 'lxml', PROFILE_STATION)
+        soup_count = len(scraper.parse_page(page, 'https://station.example/', 'Benchmark FM', 'soup'))
+        lxml_count = len(scraper.parse_page(page, 'https://station.example/', 'Benchmark FM', 'lxml'))
+        profile_count = len(scraper.parse_page(page, 'https://station.example/', 'Benchmark FM', 'lxml', PROFILE_STATION))
+        print(f"{label} ({len(page)} bytes)")
+        print(f"  soup:    {soup_rate:8.1f} pages/s  ({soup_count} articles)")
+        print(f"  lxml:    {lxml_rate:8.1f} pages/s  ({lxml_count} articles)  x{lxml_rate / soup_rate:.1f}")
+        print(f"  profile: {profile_rate:8.1f} pages/s  ({profile_count} articles)  x{profile_rate / soup_rate:.1f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
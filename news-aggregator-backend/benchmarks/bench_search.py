@@ -0,0 +1,59 @@
+"""
+Query latency of the /api/news/search index at 10k, 30k and 100k synthetic articles.
+
+Run from news-aggregator-backend/:
+
+    python -m benchmarks.bench_search [sizes ...]
+"""
+import random
+import sys
+import time
+
+from app.article import Article
+from app.search_index import SearchIndex
+from benchmarks.bench_dedup import synthetic_articles
+
+QUERIES = ['radio', 'fcc license', 'conc', 'boise tickets win', 'term12*', 'radio term1*', 'nothingmatches']
+
+
+def build(count: int) -> list:
+    rng = random.Random(7)
+    return [
+        Article.from_dict({
+            'title': article['title'],
+            'description': article['title'].lower() + ' read more at the station website',
+            'url': article['url'],
+            'published': '',
+            'published_ts': 1_760_000_000 + rng.randrange(7 * 86400),
+            'source': rng.choice(['Radio Ink', 'Inside Radio', '101.9 The Bull', 'KBOI 93.1FM & 670AM']),
+            'content_type': 'news',
+        })
+        for article in synthetic_articles(count)
+    ]
+
+
+def main(sizes: list):
+    for size in sizes:
+        articles = build(size)
+        index = SearchIndex()
+
+        start = time.perf_counter()
+        index.apply(articles, [])
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index.apply(articles[:100], articles[:100])
+        delta_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{size:>7} articles  build {build_seconds:6.2f}s  100-article delta {delta_ms:6.2f} ms")
+        for query in QUERIES:
+            runs = 50
+            start = time.perf_counter()
+            for _ in range(runs):
+                results, total = index.search(query, limit=20)
+            per_query_ms = (time.perf_counter() - start) * 1000 / runs
+            print(f"  {query!r:24} {per_query_ms:7.3f} ms  ({total} matches)")
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [10_000, 30_000, 100_000])
@@ -0,0 +1,81 @@
+import asyncio
+
+from app.article import Article
+from app.cache_manager import CacheManager
+
+
+def make_article(source_id, i, ts):
+    return Article.from_dict({
+        'title': f'{source_id} story {i}',
+        'url': f'https://{source_id}.example.com/{i}',
+        'published_ts': ts,
+    })
+
+
+def test_expire_drops_old_retained_articles_per_kind():
+    async def run():
+        manager = CacheManager()
+        await manager.apply_source_update('feed', 'national', [make_article('feed', 1, 100), make_article('feed', 2, 10)])
+        await manager.apply_source_update('station', 'local', [make_article('station', 1, 10)])
+        manager.has_unpublished_changes = False
+
+        expired = await manager.expire({'national': 50, 'local': 5})
+
+        assert expired == 1
+        assert manager.has_unpublished_changes
+        assert [article.url for article in manager.merged_view.source_articles['feed'].values()] == [
+            'https://feed.example.com/1'
+        ]
+        assert manager.sources['feed']['article_count'] == 1
+        assert len(manager.merged_view.source_articles['station']) == 1
+        assert manager.search_index.search('story 2') == ([], 0)
+
+    asyncio.run(run())
+
+
+def test_expire_without_old_articles_is_not_a_change():
+    async def run():
+        manager = CacheManager()
+        await manager.apply_source_update('feed', 'national', [make_article('feed', 1, 100)])
+        manager.has_unpublished_changes = False
+
+        assert await manager.expire({'national': 50}) == 0
+        assert not manager.has_unpublished_changes
+
+    asyncio.run(run())
+
+
+def test_refresh_waits_out_a_refresh_of_another_scope():
+    async def run():
+        manager = CacheManager()
+        calls = []
+
+        async def updater(name):
+            calls.append(f'{name} start')
+            await asyncio.sleep(0)
+            calls.append(f'{name} end')
+
+        manager.start_refresh(lambda: updater('national'), scope='national')
+        await manager.refresh(lambda: updater('local'), scope='local')
+
+        assert calls == ['national start', 'national end', 'local start', 'local end']
+
+    asyncio.run(run())
+
+
+def test_refresh_joins_a_full_or_same_scope_refresh():
+    async def run():
+        manager = CacheManager()
+        calls = []
+
+        async def updater(name):
+            calls.append(name)
+            await asyncio.sleep(0)
+
+        for scope in ('full', 'local'):
+            manager.start_refresh(lambda: updater(scope), scope=scope)
+            await manager.refresh(lambda: updater('joined'), scope='local')
+
+        assert calls == ['full', 'local']
+
+    asyncio.run(run())
@@ -0,0 +1,69 @@
+from app.circuit_breaker import CircuitBreaker
+
+
+def fail(breaker, times, now=0.0):
+    for _ in range(times):
+        breaker.record_failure('feed', now=now)
+
+
+def test_stays_closed_below_threshold():
+    breaker = CircuitBreaker(failure_threshold=3)
+    fail(breaker, 2)
+
+    assert breaker.retry_in('feed', now=0) is None
+    assert breaker.get_stats()['feed']['state'] == 'closed'
+
+
+def test_opens_at_threshold_for_base_backoff():
+    breaker = CircuitBreaker(failure_threshold=3, base_backoff=300)
+    fail(breaker, 3)
+
+    assert breaker.retry_in('feed', now=0) == 300
+    assert breaker.retry_in('feed', now=299) == 1
+    assert breaker.get_stats()['feed']['times_opened'] == 1
+
+
+def test_half_open_after_backoff():
+    breaker = CircuitBreaker(failure_threshold=3, base_backoff=300)
+    fail(breaker, 3)
+
+    # The probe is let through once the backoff has passed
+    assert breaker.retry_in('feed', now=300) is None
+
+
+def test_failed_probe_doubles_backoff_up_to_max():
+    breaker = CircuitBreaker(failure_threshold=3, base_backoff=300, max_backoff=1000)
+    fail(breaker, 3)
+
+    breaker.record_failure('feed', now=300)
+    assert breaker.retry_in('feed', now=300) == 600
+
+    breaker.record_failure('feed', now=900)
+    assert breaker.retry_in('feed', now=900) == 1000
+    assert breaker.get_stats()['feed']['times_opened'] == 1
+
+
+def test_success_closes_and_resets():
+    breaker = CircuitBreaker(failure_threshold=3, base_backoff=300)
+    fail(breaker, 3)
+
+    breaker.record_success('feed')
+
+    assert breaker.retry_in('feed', now=0) is None
+    assert breaker.get_stats()['feed']['state'] == 'closed'
+    assert breaker.get_stats()['feed']['consecutive_failures'] == 0
+
+    # The failure count starts over, and the next opening uses the base backoff again
+    fail(breaker, 2)
+    assert breaker.retry_in('feed', now=0) is None
+    fail(breaker, 1)
+    assert breaker.retry_in('feed', now=0) == 300
+
+
+def test_sources_are_independent():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure('feed', now=0)
+
+    assert breaker.retry_in('other', now=0) is None
+    breaker.record_success('other')
+    assert 'other' not in breaker.get_stats()
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+
+from app.extractors import ProfileExtractor
+from app.radio_scraper import WORDPRESS_PROFILE, BoiseRadioScraper
+
+PAGE_URL = 'https://station.example.com/news'
+
+
+def wordpress_post(title, slug, published):
+    return f"""
+    <article class="post-{slug} post type-post status-publish">
+      <h2 class="entry-title"><a href="/{slug}/">{title}</a></h2>
+      <img src="/images/{slug}.jpg">
+      <time datetime="{published.strftime('%Y-%m-%dT%H:%M:%S%z')}">Yesterday</time>
+      <div class="entry-summary"><p>Summary of {title}</p></div>
+    </article>
+    """
+
+
+def test_wordpress_profile_extracts_post_fields():
+    published = datetime(2026, 10, 17, 8, 30, tzinfo=timezone.utc)
+    page = f"<html><body>{wordpress_post('Morning show adds new host', 'new-host', published)}</body></html>"
+
+    candidates = ProfileExtractor(WORDPRESS_PROFILE).extract(page.encode())
+
+    assert candidates == [{
+        'title': 'Morning show adds new host',
+        'link': '/new-host/',
+        'description': 'Summary of Morning show adds new host',
+        'image': '/images/new-host.jpg',
+        'date': '2026-10-17T08:30:00+0000',
+    }]
+
+
+def test_parse_page_uses_station_profile():
+    scraper = BoiseRadioScraper()
+    scraper.extraction_profiles['kboi'] = ProfileExtractor(WORDPRESS_PROFILE)
+    published = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(hours=2)
+    page = f"<html><body>{wordpress_post('Station hosts fall concert series', 'concerts', published)}</body></html>"
+
+    articles = scraper.parse_page(page.encode(), PAGE_URL, 'KBOI', engine='lxml', station_id='kboi')
+
+    assert len(articles) == 1
+    assert articles[0]['url'] == 'https://station.example.com/concerts/'
+    assert articles[0]['image'] == 'https://station.example.com/images/concerts.jpg'
+    assert articles[0]['published_ts'] == int(published.timestamp())
+
+
+def test_parse_page_falls_back_when_profile_finds_no_titles():
+    scraper = BoiseRadioScraper()
+    scraper.extraction_profiles['kboi'] = ProfileExtractor(WORDPRESS_PROFILE)
+    # The profile only matches an untitled post; the generic engine still finds the card
+    page = b"""
+    <html><body>
+      <article class="type-post"><p>Sponsored</p></article>
+      <div class="card">
+        <h3 class="headline">Listeners pick the fall playlist</h3>
+        <a href="/playlist">Read more</a>
+      </div>
+    </body></html>
+    """
+
+    for engine in ('lxml', 'soup'):
+        articles = scraper.parse_page(page, PAGE_URL, 'KBOI', engine=engine, station_id='kboi')
+
+        assert [article['title'] for article in articles] == ['Listeners pick the fall playlist']
+        assert articles[0]['url'] == 'https://station.example.com/playlist'
@@ -0,0 +1,86 @@
+import random
+
+from app.aggregator_service import AggregatorService
+from app.article import Article
+from app.merged_view import MergedView
+
+WORDS = ['radio', 'station', 'fcc', 'boise', 'concert', 'morning', 'show', 'ratings', 'podcast', 'license']
+
+
+def make_article(url, ts, title, source='Test'):
+    return Article.from_dict({'title': title, 'url': url, 'published_ts': ts, 'source': source})
+
+
+def baseline(view):
+    """remove_duplicates over every article the view holds, in the view's newest-first order"""
+    entries = sorted(view.entries.items(), key=lambda item: (item[1].published_ts, item[0]), reverse=True)
+    return AggregatorService.remove_duplicates([article for _, article in entries])
+
+
+def test_newer_duplicate_shadows_older():
+    view = MergedView()
+    view.apply('a', [make_article('x/1', 1, 'Station sold to new owner')])
+    added, removed = view.apply('b', [make_article('x/1', 2, 'Station sold to new owner')])
+
+    assert [article.published_ts for article in view.articles()] == [2]
+    assert [article.published_ts for article in added] == [2]
+    assert [article.published_ts for article in removed] == [1]
+
+
+def test_removing_winner_reveals_shadowed_article():
+    view = MergedView()
+    older = make_article('x/1', 1, 'Station sold to new owner')
+    view.apply('a', [older])
+    view.apply('b', [make_article('x/1', 2, 'Station sold to new owner')])
+
+    added, removed = view.drop_source('b')
+
+    assert view.articles() == [older]
+    assert added == [older]
+    assert [article.published_ts for article in removed] == [2]
+
+
+def test_unchanged_apply_reports_no_delta():
+    view = MergedView()
+    articles = [make_article(f'x/{i}', i, f'Headline number {i}') for i in range(5)]
+    view.apply('a', articles)
+
+    assert view.apply('a', list(articles)) == ([], [])
+    assert view.articles() == sorted(articles, key=lambda article: article.published_ts, reverse=True)
+
+
+def test_displaced_winner_releases_unrelated_shadows():
+    view = MergedView()
+    b = make_article('x/1', 0, 'Completely unrelated words here')
+    a = make_article('x/1', 1, 'Boise radio station wins award')
+    c = make_article('y/2', 2, 'Boise radio station wins award today')
+    view.apply('b', [b])
+    view.apply('a', [a])
+    view.apply('c', [c])
+
+    assert view.articles() == [c, b]
+    assert view.articles() == baseline(view)
+
+
+def test_randomized_apply_sequences_match_remove_duplicates():
+    rng = random.Random(8)
+    for _ in range(300):
+        view = MergedView()
+        visible = []
+        for _ in range(rng.randint(1, 12)):
+            source_id = rng.choice('abcd')
+            articles = []
+            for _ in range(rng.randint(0, 6)):
+                words = [rng.choice(WORDS) for _ in range(rng.randint(3, 5))]
+                articles.append(make_article(f'x/{rng.randrange(8)}', rng.randrange(10), ' '.join(words)))
+
+            added, removed = view.apply(source_id, articles)
+
+            expected = baseline(view)
+            assert view.articles() == expected
+            # The delta is exactly what stopped and started being visible
+            before = {id(article) for article in visible}
+            after = {id(article) for article in expected}
+            assert {id(article) for article in added} == after - before
+            assert {id(article) for article in removed} == before - after
+            visible = expected
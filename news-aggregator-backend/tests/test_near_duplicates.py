@@ -0,0 +1,79 @@
+import random
+
+from app.aggregator_service import AggregatorService
+from app.near_duplicates import NearDuplicateIndex
+
+WORDS = ['radio', 'station', 'fcc', 'boise', 'the', 'a', 'to', 'new', 'concert', 'morning', 'show', 'host', 'win']
+
+
+def random_titles(rng, count):
+    titles = []
+    for _ in range(count):
+        if titles and rng.random() < 0.4:
+            words = rng.choice(titles).split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+        else:
+            words = [rng.choice(WORDS) for _ in range(rng.randint(1, 8))]
+        titles.append(' '.join(words))
+    return titles
+
+
+def test_similar_matches_pairwise_scan():
+    rng = random.Random(13)
+    for threshold in (0.5, 0.8, 1.0):
+        titles = random_titles(rng, 300)
+        index = NearDuplicateIndex(threshold)
+        for key, title in enumerate(titles[:200]):
+            index.add(key, title)
+
+        for title in titles:
+            expected = {
+                key for key, other in enumerate(titles[:200])
+                if AggregatorService.titles_are_similar(title, other, threshold)
+            }
+            assert set(index.similar(title)) == expected
+
+
+def test_remove_and_replace():
+    index = NearDuplicateIndex()
+    index.add('a', 'station sold to new owner')
+    index.add('b', 'morning show host retires')
+
+    index.remove('a')
+    assert index.similar('station sold to new owner') == []
+    assert 'a' not in index and len(index) == 1
+
+    index.add('b', 'station sold to new owner')
+    assert index.similar('station sold to new owner') == ['b']
+    assert index.similar('morning show host retires') == []
+
+
+def test_empty_titles_never_match():
+    index = NearDuplicateIndex()
+    index.add('empty', '')
+
+    assert index.similar('') == []
+    assert index.find('anything at all') is None
+
+
+def test_remove_duplicates_matches_pairwise_scan():
+    rng = random.Random(7)
+    articles = [
+        {'title': title, 'url': f'https://example.com/{rng.randrange(400)}'}
+        for title in random_titles(rng, 500)
+    ]
+
+    expected = []
+    seen_urls = set()
+    seen_titles = []
+    for article in articles:
+        if article['url'] in seen_urls:
+            continue
+        normalized = AggregatorService.normalize_title(article['title'])
+        if any(AggregatorService.titles_are_similar(normalized, seen) for seen in seen_titles):
+            continue
+        expected.append(article)
+        seen_urls.add(article['url'])
+        seen_titles.append(normalized)
+
+    assert AggregatorService.remove_duplicates(articles) == expected
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from app.article import Article
+from app.news_index import NewsIndex, decode_cursor, encode_cursor
+
+
+def build_entries(rng, count):
+    """(key, article) pairs newest first, as MergedView.ordered_items() yields them"""
+    entries = []
+    for i in range(count):
+        article = Article.from_dict({
+            'title': f'Story {i}',
+            'url': f'https://example.com/{i}',
+            'published_ts': rng.randrange(50),
+            'source': rng.choice(['Radio Ink', 'KBOI', 'Wild 101']),
+            'content_type': rng.choice(['news', 'contest', 'event']),
+        })
+        entries.append((f'source\x00https://example.com/{i}', article))
+    entries.sort(key=lambda entry: (entry[1].published_ts, entry[0]), reverse=True)
+    return entries
+
+
+def read_all_pages(index, limit, **filters):
+    articles = []
+    after = None
+    while True:
+        page, after, total = index.page(after=after, limit=limit, **filters)
+        articles.extend(page)
+        if after is None:
+            return articles, total
+
+
+def test_cursor_paging_matches_filtered_scan():
+    rng = random.Random(18)
+    entries = build_entries(rng, 200)
+    index = NewsIndex(entries)
+
+    for source in (None, 'KBOI'):
+        for content_type in (None, 'contest'):
+            for since_ts in (None, 25):
+                expected = [
+                    article for _, article in entries
+                    if (source is None or article.source == source)
+                    and (content_type is None or article.content_type == content_type)
+                    and (since_ts is None or article.published_ts >= since_ts)
+                ]
+                for limit in (1, 7, 500):
+                    articles, total = read_all_pages(
+                        index, limit, source=source, content_type=content_type, since_ts=since_ts
+                    )
+                    assert articles == expected
+                    assert total == len(expected)
+
+
+def test_cursor_survives_a_rebuilt_index():
+    rng = random.Random(5)
+    entries = build_entries(rng, 60)
+    page, after, _ = NewsIndex(entries).page(limit=10)
+
+    # A newer version adds articles at the top; the cursor still continues after the same article
+    newer = [(f'new\x00{i}', Article.from_dict({'title': 'New', 'url': f'n/{i}', 'published_ts': 100}))
+             for i in range(5)]
+    next_page, _, _ = NewsIndex(newer + entries).page(after=after, limit=10)
+
+    assert next_page == [article for _, article in entries[10:20]]
+
+
+def test_last_page_has_no_cursor():
+    entries = build_entries(random.Random(1), 10)
+
+    page, after, total = NewsIndex(entries).page(limit=10)
+
+    assert len(page) == 10 and after is None and total == 10
+
+
+def test_cursor_round_trip():
+    position = (1760000000, 'kboi\x00https://kboi.com/a?b=c')
+
+    assert decode_cursor(encode_cursor(position)) == position
+
+
+@pytest.mark.parametrize('cursor', ['not-a-cursor', '', encode_cursor(('1760000000', 'key'))])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
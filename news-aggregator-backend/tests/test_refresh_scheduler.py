@@ -0,0 +1,103 @@
+import pytest
+
+from app.article import Article
+from app.refresh_scheduler import RefreshScheduler
+
+HOUR = 3600
+
+
+def make_scheduler(**kwargs):
+    # No jitter, so due times are exact
+    return RefreshScheduler(jitter=0, **kwargs)
+
+
+def articles(*timestamps):
+    return [Article.from_dict({'url': f'https://example.com/{ts}', 'published_ts': ts}) for ts in timestamps]
+
+
+def test_never_fetched_sources_are_due():
+    scheduler = make_scheduler()
+
+    assert scheduler.due(['a', 'b'], now=0) == ['a', 'b']
+    assert scheduler.seconds_until_due(['a'], now=0) == 0
+
+
+def test_first_fetch_uses_initial_interval():
+    scheduler = make_scheduler(initial_interval=HOUR)
+    scheduler.record('a', [], now=0)
+
+    assert scheduler.due(['a'], now=HOUR - 1) == []
+    assert scheduler.due(['a'], now=HOUR - 1, within=1) == ['a']
+    assert scheduler.seconds_until_due(['a'], now=0) == HOUR
+
+
+def test_unchanged_fetches_back_off_up_to_max_interval():
+    scheduler = make_scheduler(initial_interval=HOUR, backoff=1.5, max_interval=3 * HOUR)
+    scheduler.record('a', [], now=0)
+
+    scheduler.record('a', [], now=0)
+    assert scheduler.sources['a'].interval == 1.5 * HOUR
+
+    for _ in range(5):
+        scheduler.record('a', [], now=0)
+    assert scheduler.sources['a'].interval == 3 * HOUR
+    assert scheduler.sources['a'].unchanged_rate > 0.5
+
+
+def test_changed_fetches_speed_up_down_to_min_interval():
+    scheduler = make_scheduler(initial_interval=HOUR, speedup=0.5, min_interval=20 * 60)
+    scheduler.record('a', articles(), now=0)
+
+    scheduler.record('a', articles(1), now=0)
+    assert scheduler.sources['a'].interval == 0.5 * HOUR
+
+    scheduler.record('a', articles(1, 2), now=0)
+    assert scheduler.sources['a'].interval == 20 * 60
+
+
+def test_interval_is_capped_at_publish_cadence():
+    scheduler = make_scheduler(initial_interval=6 * HOUR)
+
+    # Articles every 2 hours (a duplicate timestamp does not count as a gap)
+    scheduler.record('a', articles(0, 2 * HOUR, 2 * HOUR, 4 * HOUR, 6 * HOUR), now=0)
+
+    assert scheduler.sources['a'].cadence == 2 * HOUR
+    assert scheduler.sources['a'].interval == 2 * HOUR
+
+
+def test_failure_keeps_interval_and_retries_after_it():
+    scheduler = make_scheduler(initial_interval=HOUR)
+    scheduler.record('a', [], now=0)
+
+    scheduler.record('a', None, now=100)
+
+    assert scheduler.sources['a'].interval == HOUR
+    assert scheduler.sources['a'].failures == 1
+    assert scheduler.sources['a'].next_due == 100 + HOUR
+
+
+def test_postpone_only_moves_due_time_later():
+    scheduler = make_scheduler(initial_interval=HOUR)
+    scheduler.record('a', [], now=0)
+
+    scheduler.postpone('a', 60, now=0)
+    assert scheduler.sources['a'].next_due == HOUR
+
+    scheduler.postpone('a', 2 * HOUR, now=0)
+    assert scheduler.sources['a'].next_due == 2 * HOUR
+    assert scheduler.sources['a'].interval == HOUR
+
+
+def test_jitter_stays_within_bounds():
+    scheduler = RefreshScheduler(initial_interval=HOUR, jitter=0.1)
+    for i in range(200):
+        scheduler.record(f'source-{i}', [], now=0)
+
+    due_times = [schedule.next_due for schedule in scheduler.sources.values()]
+    assert all(0.9 * HOUR <= due <= 1.1 * HOUR for due in due_times)
+    assert len(set(due_times)) > 1
+
+
+@pytest.mark.parametrize('timestamps', [(), (5,), (0, 0)])
+def test_no_cadence_without_two_distinct_timestamps(timestamps):
+    assert make_scheduler().publish_cadence(articles(*timestamps)) is None
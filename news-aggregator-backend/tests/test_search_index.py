@@ -0,0 +1,85 @@
+import random
+
+from app.article import Article
+from app.search_index import SearchIndex, tokenize
+
+WORDS = ['radio', 'station', 'boise', 'concert', 'contest', 'tickets', 'morning', 'show', 'country', 'countdown']
+
+
+def make_article(i, title, description='', ts=None):
+    return Article.from_dict({
+        'title': title,
+        'description': description,
+        'url': f'https://example.com/{i}',
+        'published_ts': i if ts is None else ts,
+    })
+
+
+def scan(articles, query, prefix=True):
+    """Reference search: every term must match a token exactly, prefix terms by prefix"""
+    terms = []
+    for raw_term in query.split():
+        terms.extend((term, raw_term.endswith('*')) for term in tokenize(raw_term))
+    if not terms:
+        return []
+    if prefix:
+        terms[-1] = (terms[-1][0], True)
+
+    matches = []
+    for article in articles:
+        tokens = set(tokenize(f"{article.title} {article.description}"))
+        if all(any(token.startswith(term) for token in tokens) if is_prefix else term in tokens
+               for term, is_prefix in terms):
+            matches.append(article)
+    return sorted(matches, key=lambda article: (article.published_ts, article.url), reverse=True)
+
+
+def test_search_matches_scan():
+    rng = random.Random(19)
+    articles = [
+        make_article(i, ' '.join(rng.choice(WORDS) for _ in range(4)), ' '.join(rng.choice(WORDS) for _ in range(3)))
+        for i in range(150)
+    ]
+    index = SearchIndex()
+    index.apply(articles, [])
+
+    queries = ['radio', 'radio boise', 'count', 'country*', 'coun* show', 'tick con', 'missing', 'Radio, Boise!']
+    for query in queries:
+        for prefix in (True, False):
+            expected = scan(articles, query, prefix)
+            results, total = index.search(query, limit=10, prefix=prefix)
+            assert total == len(expected)
+            assert results == expected[:10]
+
+
+def test_deltas_add_and_remove_documents():
+    index = SearchIndex()
+    old = make_article(1, 'Station announces concert')
+    new = make_article(2, 'Station announces contest')
+    index.apply([old], [])
+
+    index.apply([new], [old])
+
+    assert index.search('concert') == ([], 0)
+    assert index.search('contest') == ([new], 1)
+    assert len(index) == 1
+    # Tokens only the removed article had leave the vocabulary
+    assert 'concert' not in index.vocabulary
+
+
+def test_adding_the_same_article_twice_is_a_no_op():
+    index = SearchIndex()
+    article = make_article(1, 'Morning show')
+    index.add(article)
+    index.add(article)
+
+    assert len(index) == 1
+    assert index.search('morning') == ([article], 1)
+
+
+def test_empty_query_matches_nothing():
+    index = SearchIndex()
+    index.add(make_article(1, 'Morning show'))
+
+    assert index.search('   ') == ([], 0)
+    assert index.search('!!!') == ([], 0)
@@ -0,0 +1,76 @@
+import random
+
+from app.selection import DiversitySelector
+
+
+def window_filter(articles, window_size, max_per_window):
+    """The original O(n*w) loop from BoiseRadioScraper.apply_diversity_filter"""
+    filtered = []
+    for article in articles:
+        recent_articles = filtered[max(0, len(filtered) - window_size):]
+        count_in_window = sum(1 for a in recent_articles if a['source'] == article['source'])
+        if count_in_window < max_per_window:
+            filtered.append(article)
+    return filtered
+
+
+def random_articles(rng, count, sources):
+    return [{'source': rng.choice(sources), 'url': f'https://example.com/{i}'} for i in range(count)]
+
+
+def test_matches_window_loop_on_random_inputs():
+    rng = random.Random(16)
+    for _ in range(300):
+        sources = [f'station-{i}' for i in range(rng.randint(1, 8))]
+        articles = random_articles(rng, rng.randint(0, 80), sources)
+        window_size = rng.randint(1, 12)
+        max_per_window = rng.randint(1, 4)
+
+        selector = DiversitySelector(window_size=window_size, max_per_window=max_per_window)
+
+        assert list(selector.select(articles)) == window_filter(articles, window_size, max_per_window)
+
+
+def test_limit_is_a_prefix_of_the_unlimited_selection():
+    rng = random.Random(3)
+    articles = random_articles(rng, 200, ['a', 'b', 'c'])
+    unlimited = list(DiversitySelector(window_size=10, max_per_window=2).select(articles))
+
+    assert list(DiversitySelector(window_size=10, max_per_window=2, limit=7).select(articles)) == unlimited[:7]
+
+
+def test_stops_pulling_candidates_at_limit():
+    pulled = []
+
+    def candidates():
+        for i in range(1000):
+            pulled.append(i)
+            yield {'source': f'station-{i}'}
+
+    selected = list(DiversitySelector(limit=5).select(candidates()))
+
+    assert len(selected) == 5
+    assert len(pulled) == 5
+
+
+def test_weighted_quotas_cap_each_source():
+    weights = {'big': 18.0, 'small': 7.0}
+    articles = [{'source': source} for source in ['small'] * 100 + ['big'] * 100]
+    selector = DiversitySelector(window_size=100, max_per_window=100, weights=weights, limit=100)
+
+    selected = list(selector.select(articles))
+
+    # 7 / 25 * 100 is 28.000000000000004 in floating point; the quota must still be 28
+    assert sum(1 for article in selected if article['source'] == 'small') == 28
+    assert sum(1 for article in selected if article['source'] == 'big') == 72
+
+
+def test_sources_without_weight_are_not_quota_limited():
+    articles = [{'source': 'unweighted'} for _ in range(20)]
+    selector = DiversitySelector(window_size=20, max_per_window=20, weights={'other': 1.0}, limit=10)
+
+    assert len(list(selector.select(articles))) == 10
+
+
+def test_zero_limit_selects_nothing():
+    assert list(DiversitySelector(limit=0).select([{'source': 'a'}])) == []